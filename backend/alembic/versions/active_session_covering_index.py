@@ -0,0 +1,38 @@
+"""Cover the active-session unique index with id and last_activity_at
+
+Revision ID: active_session_covering_index
+Revises: domain_config_generated_counts
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'active_session_covering_index'
+down_revision = 'domain_config_generated_counts'
+branch_labels = None
+depends_on = None
+
+
+def _swap_index(columns_sql: str) -> None:
+    """Build the replacement next to the old index, then swap names."""
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY uq_user_domain_active_session_new "
+            f"ON chat_sessions {columns_sql} WHERE status = 'active'"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS uq_user_domain_active_session")
+        op.execute(
+            "ALTER INDEX uq_user_domain_active_session_new "
+            "RENAME TO uq_user_domain_active_session"
+        )
+
+
+def upgrade():
+    """Recreate the partial unique index with INCLUDE (id, last_activity_at)."""
+    _swap_index("(user_id, domain_config_id) INCLUDE (id, last_activity_at)")
+
+
+def downgrade():
+    """Recreate the partial unique index without INCLUDE columns."""
+    _swap_index("(user_id, domain_config_id)")
@@ -0,0 +1,40 @@
+"""Drop the INCLUDE columns from the active-session unique index
+
+Revision ID: active_session_index_without_include
+Revises: users_email_lower_unique
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'active_session_index_without_include'
+down_revision = 'users_email_lower_unique'
+branch_labels = None
+depends_on = None
+
+
+def _swap_index(columns_sql: str) -> None:
+    """Build the replacement next to the old index, then swap names."""
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY uq_user_domain_active_session_new "
+            f"ON chat_sessions {columns_sql} WHERE status = 'active'"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS uq_user_domain_active_session")
+        op.execute(
+            "ALTER INDEX uq_user_domain_active_session_new "
+            "RENAME TO uq_user_domain_active_session"
+        )
+
+
+def upgrade():
+    """Recreate the partial unique index without INCLUDE columns."""
+    # The lookup loads whole rows, so the INCLUDE never gave an index-only
+    # scan, and last_activity_at in it blocked HOT updates on every turn
+    _swap_index("(user_id, domain_config_id)")
+
+
+def downgrade():
+    """Recreate the partial unique index with INCLUDE (id, last_activity_at)."""
+    _swap_index("(user_id, domain_config_id) INCLUDE (id, last_activity_at)")
@@ -0,0 +1,44 @@
+"""Store chat message role as SMALLINT
+
+Revision ID: chat_message_role_smallint
+Revises: 88bbfe046963
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'chat_message_role_smallint'
+down_revision = '88bbfe046963'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Convert chat_messages.role from the message_role ENUM to SMALLINT codes."""
+    op.alter_column(
+        'chat_messages',
+        'role',
+        type_=sa.SmallInteger(),
+        existing_nullable=False,
+        postgresql_using=(
+            "CASE role::text "
+            "WHEN 'user' THEN 0 WHEN 'assistant' THEN 1 WHEN 'system' THEN 2 END"
+        ),
+    )
+    op.execute("DROP TYPE message_role")
+
+
+def downgrade():
+    """Restore the message_role ENUM column."""
+    op.execute("CREATE TYPE message_role AS ENUM ('user', 'assistant', 'system')")
+    op.alter_column(
+        'chat_messages',
+        'role',
+        type_=sa.Enum('user', 'assistant', 'system', name='message_role'),
+        existing_nullable=False,
+        postgresql_using=(
+            "(CASE role WHEN 0 THEN 'user' WHEN 1 THEN 'assistant' WHEN 2 THEN 'system' END)::message_role"
+        ),
+    )
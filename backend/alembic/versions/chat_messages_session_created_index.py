@@ -0,0 +1,29 @@
+"""Index chat_messages by (session_id, created_at)
+
+Revision ID: chat_messages_session_created_index
+Revises: jsonb_lz4_compression
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'chat_messages_session_created_index'
+down_revision = 'jsonb_lz4_compression'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create the composite index dropped by 88bbfe046963 under its new name."""
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_chat_messages_session_created "
+            "ON chat_messages (session_id, created_at)"
+        )
+
+
+def downgrade():
+    """Drop the composite index."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_chat_messages_session_created")
@@ -0,0 +1,29 @@
+"""Add GIN index on chat_sessions.session_metadata
+
+Revision ID: chat_session_metadata_gin
+Revises: chat_message_role_smallint
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'chat_session_metadata_gin'
+down_revision = 'chat_message_role_smallint'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create a jsonb_path_ops GIN index without locking writes."""
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_chat_sessions_metadata_gin "
+            "ON chat_sessions USING gin (session_metadata jsonb_path_ops)"
+        )
+
+
+def downgrade():
+    """Drop the session_metadata GIN index."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_chat_sessions_metadata_gin")
@@ -0,0 +1,50 @@
+"""Store chat session status as CHECK-constrained VARCHAR
+
+Revision ID: chat_session_status_varchar
+Revises: timestamptz_server_defaults
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'chat_session_status_varchar'
+down_revision = 'timestamptz_server_defaults'
+branch_labels = None
+depends_on = None
+
+# The partial unique index predicate references the column type, so it is
+# dropped before the type change and rebuilt afterwards.
+ACTIVE_SESSION_INDEX = (
+    "CREATE UNIQUE INDEX uq_user_domain_active_session "
+    "ON chat_sessions (user_id, domain_config_id) INCLUDE (id, last_activity_at) "
+    "WHERE status = 'active'"
+)
+
+
+def upgrade():
+    """Replace the session_status ENUM with VARCHAR(16) and a CHECK constraint."""
+    op.execute("DROP INDEX IF EXISTS uq_user_domain_active_session")
+    op.execute("""
+        ALTER TABLE chat_sessions
+            ALTER COLUMN status DROP DEFAULT,
+            ALTER COLUMN status TYPE varchar(16) USING status::text,
+            ALTER COLUMN status SET DEFAULT 'active',
+            ADD CONSTRAINT ck_chat_sessions_status CHECK (status IN ('active', 'closed'))
+    """)
+    op.execute("DROP TYPE session_status")
+    op.execute(ACTIVE_SESSION_INDEX)
+
+
+def downgrade():
+    """Restore the session_status ENUM column."""
+    op.execute("DROP INDEX IF EXISTS uq_user_domain_active_session")
+    op.execute("CREATE TYPE session_status AS ENUM ('active', 'closed')")
+    op.execute("""
+        ALTER TABLE chat_sessions
+            DROP CONSTRAINT ck_chat_sessions_status,
+            ALTER COLUMN status DROP DEFAULT,
+            ALTER COLUMN status TYPE session_status USING status::session_status,
+            ALTER COLUMN status SET DEFAULT 'active'
+    """)
+    op.execute(ACTIVE_SESSION_INDEX)
@@ -0,0 +1,59 @@
+"""Generate domain_configs count columns from config_json
+
+Revision ID: domain_config_generated_counts
+Revises: domain_config_json_gin
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'domain_config_generated_counts'
+down_revision = 'domain_config_json_gin'
+branch_labels = None
+depends_on = None
+
+COUNT_COLUMNS = {
+    'entity_count': 'entities',
+    'relationship_count': 'relationships',
+    'extraction_pattern_count': 'extraction_patterns',
+    'key_term_count': 'key_terms',
+}
+
+
+def _count_sql(key: str) -> str:
+    """Array length of config_json->key; 0 when missing or not an array."""
+    # jsonb_array_length raises on null/object/scalar values, which would
+    # fail the INSERT/UPDATE itself
+    return (
+        f"CASE WHEN jsonb_typeof(config_json->'{key}') = 'array' "
+        f"THEN jsonb_array_length(config_json->'{key}') ELSE 0 END"
+    )
+
+
+def upgrade():
+    """Replace the Python-maintained counts with STORED generated columns."""
+    clauses = []
+    for column, key in COUNT_COLUMNS.items():
+        clauses.append(f"DROP COLUMN {column}")
+        clauses.append(
+            f"ADD COLUMN {column} integer NOT NULL GENERATED ALWAYS AS "
+            f"({_count_sql(key)}) STORED"
+        )
+    op.execute(f"ALTER TABLE domain_configs {', '.join(clauses)}")
+
+
+def downgrade():
+    """Restore plain integer count columns, backfilled from config_json."""
+    clauses = []
+    for column in COUNT_COLUMNS:
+        clauses.append(f"DROP COLUMN {column}")
+        clauses.append(f"ADD COLUMN {column} integer NOT NULL DEFAULT 0")
+    op.execute(f"ALTER TABLE domain_configs {', '.join(clauses)}")
+    op.execute(
+        "UPDATE domain_configs SET "
+        + ", ".join(
+            f"{column} = {_count_sql(key)}"
+            for column, key in COUNT_COLUMNS.items()
+        )
+    )
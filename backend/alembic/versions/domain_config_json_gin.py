@@ -0,0 +1,29 @@
+"""Add GIN index on domain_configs.config_json
+
+Revision ID: domain_config_json_gin
+Revises: chat_session_metadata_gin
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'domain_config_json_gin'
+down_revision = 'chat_session_metadata_gin'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create a jsonb_path_ops GIN index without locking writes."""
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_domain_configs_config_gin "
+            "ON domain_configs USING gin (config_json jsonb_path_ops)"
+        )
+
+
+def downgrade():
+    """Drop the config_json GIN index."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_domain_configs_config_gin")
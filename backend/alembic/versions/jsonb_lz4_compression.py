@@ -0,0 +1,51 @@
+"""Compress large JSONB columns with lz4
+
+Revision ID: jsonb_lz4_compression
+Revises: node_call_logs_smallint_codes
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'jsonb_lz4_compression'
+down_revision = 'node_call_logs_smallint_codes'
+branch_labels = None
+depends_on = None
+
+JSONB_COLUMNS = [
+    ('domain_configs', 'config_json'),
+    ('chat_sessions', 'session_metadata'),
+]
+
+
+def _supports_column_compression() -> bool:
+    """Per-column TOAST compression requires PostgreSQL 14+."""
+    version = op.get_bind().exec_driver_sql("SHOW server_version_num").scalar()
+    return int(version) >= 140000
+
+
+def _supports_lz4() -> bool:
+    """lz4 is only available when the server was built with --with-lz4."""
+    if not _supports_column_compression():
+        return False
+    return op.get_bind().exec_driver_sql(
+        "SELECT 1 FROM pg_settings "
+        "WHERE name = 'default_toast_compression' AND 'lz4' = ANY(enumvals)"
+    ).scalar() is not None
+
+
+def upgrade():
+    """Use lz4 for newly written TOAST values of the large JSONB columns."""
+    if not _supports_lz4():
+        return
+    for table, column in JSONB_COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET COMPRESSION lz4")
+
+
+def downgrade():
+    """Return the JSONB columns to the server's default compression."""
+    if not _supports_column_compression():
+        return
+    for table, column in JSONB_COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET COMPRESSION default")
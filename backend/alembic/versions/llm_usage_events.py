@@ -0,0 +1,64 @@
+"""Replace the llm_usage_stats counter row with an append-only event log
+
+Revision ID: llm_usage_events
+Revises: node_call_logs_covering_index
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = 'llm_usage_events'
+down_revision = 'node_call_logs_covering_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create llm_usage_events and expose its totals as the llm_usage_stats view."""
+    op.create_table(
+        'llm_usage_events',
+        sa.Column('id', sa.BigInteger(), sa.Identity(always=True), primary_key=True),
+        sa.Column('calls', sa.Integer(), nullable=False),
+        sa.Column('input_tokens', sa.Integer(), nullable=False),
+        sa.Column('output_tokens', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    )
+    # Carry the existing totals over as a single opening event
+    op.execute("""
+        INSERT INTO llm_usage_events (calls, input_tokens, output_tokens, created_at)
+        SELECT total_calls, total_input_tokens, total_output_tokens, last_updated
+        FROM llm_usage_stats
+    """)
+    op.drop_table('llm_usage_stats')
+    op.execute("""
+        CREATE VIEW llm_usage_stats AS
+        SELECT
+            coalesce(sum(calls), 0)::bigint AS total_calls,
+            coalesce(sum(input_tokens), 0)::bigint AS total_input_tokens,
+            coalesce(sum(output_tokens), 0)::bigint AS total_output_tokens,
+            max(created_at) AS last_updated
+        FROM llm_usage_events
+    """)
+
+
+def downgrade():
+    """Restore the single-row llm_usage_stats counter table."""
+    op.execute("ALTER VIEW llm_usage_stats RENAME TO llm_usage_stats_view")
+    op.create_table(
+        'llm_usage_stats',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('total_calls', sa.Integer(), nullable=False),
+        sa.Column('total_input_tokens', sa.Integer(), nullable=False),
+        sa.Column('total_output_tokens', sa.Integer(), nullable=False),
+        sa.Column('last_updated', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    )
+    op.execute("""
+        INSERT INTO llm_usage_stats (id, total_calls, total_input_tokens, total_output_tokens, last_updated)
+        SELECT gen_random_uuid(), total_calls, total_input_tokens, total_output_tokens, coalesce(last_updated, now())
+        FROM llm_usage_stats_view
+    """)
+    op.execute("DROP VIEW llm_usage_stats_view")
+    op.drop_table('llm_usage_events')
@@ -0,0 +1,34 @@
+"""Add covering index for per-session node call aggregates
+
+Revision ID: node_call_logs_covering_index
+Revises: chat_session_status_varchar
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'node_call_logs_covering_index'
+down_revision = 'chat_session_status_varchar'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Replace the plain session_id index with one that INCLUDEs the metrics."""
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_node_call_logs_session_tokens "
+            "ON node_call_logs (session_id) INCLUDE (input_tokens, output_tokens, response_time_ms)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_node_call_logs_session_id")
+
+
+def downgrade():
+    """Restore the plain session_id index."""
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_node_call_logs_session_id "
+            "ON node_call_logs (session_id)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_node_call_logs_session_tokens")
@@ -0,0 +1,60 @@
+"""Store node_call_logs node_name and intent as SMALLINT codes
+
+Revision ID: node_call_logs_smallint_codes
+Revises: llm_usage_events
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'node_call_logs_smallint_codes'
+down_revision = 'llm_usage_events'
+branch_labels = None
+depends_on = None
+
+# Snapshot of app.models.node_call_log codes at the time of this migration
+NODE_NAME_CODES = {
+    "classify_intent": 1,
+    "generate_patch": 2,
+    "generate_response_error": 3,
+    "generate_response_info": 4,
+    "general_knowledge": 5,
+}
+
+INTENT_CODES = {
+    "domain_operation": 1,
+    "entity_operation": 2,
+    "relationship_operation": 3,
+    "extraction_pattern_operation": 4,
+    "key_term_operation": 5,
+    "info_query": 6,
+    "general_query": 7,
+}
+
+
+def _encode(column, codes):
+    whens = " ".join(f"WHEN '{value}' THEN {code}" for value, code in codes.items())
+    return f"CASE {column} {whens} END"
+
+
+def _decode(column, codes):
+    whens = " ".join(f"WHEN {code} THEN '{value}'" for value, code in codes.items())
+    return f"CASE {column} {whens} END"
+
+
+def upgrade():
+    """Rewrite node_name and intent from varchar to SMALLINT codes."""
+    op.alter_column('node_call_logs', 'node_name', type_=sa.SmallInteger(), existing_nullable=False,
+                    postgresql_using=_encode('node_name', NODE_NAME_CODES))
+    op.alter_column('node_call_logs', 'intent', type_=sa.SmallInteger(), existing_nullable=True,
+                    postgresql_using=_encode('intent', INTENT_CODES))
+
+
+def downgrade():
+    """Restore node_name and intent as varchar."""
+    op.alter_column('node_call_logs', 'node_name', type_=sa.String(), existing_nullable=False,
+                    postgresql_using=_decode('node_name', NODE_NAME_CODES))
+    op.alter_column('node_call_logs', 'intent', type_=sa.String(), existing_nullable=True,
+                    postgresql_using=_decode('intent', INTENT_CODES))
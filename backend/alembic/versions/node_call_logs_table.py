@@ -0,0 +1,45 @@
+"""Create the node_call_logs table
+
+Revision ID: node_call_logs_table
+Revises: active_session_covering_index
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = 'node_call_logs_table'
+down_revision = 'active_session_covering_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create node_call_logs and its session indexes."""
+    # The model was added without a migration; databases built with
+    # create_all already have the table
+    if sa.inspect(op.get_bind()).has_table('node_call_logs'):
+        return
+    op.create_table(
+        'node_call_logs',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('session_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('chat_sessions.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('turn', sa.Integer(), nullable=False),
+        sa.Column('node_name', sa.String(), nullable=False),
+        sa.Column('input_tokens', sa.Integer(), nullable=False),
+        sa.Column('output_tokens', sa.Integer(), nullable=False),
+        sa.Column('response_time_ms', sa.Float(), nullable=False),
+        sa.Column('intent', sa.String(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+    )
+    op.create_index('ix_node_call_logs_session_id', 'node_call_logs', ['session_id'])
+    op.create_index('ix_node_call_logs_session_turn', 'node_call_logs', ['session_id', 'turn'])
+
+
+def downgrade():
+    """Drop node_call_logs and its indexes."""
+    op.drop_index('ix_node_call_logs_session_turn', table_name='node_call_logs')
+    op.drop_index('ix_node_call_logs_session_id', table_name='node_call_logs')
+    op.drop_table('node_call_logs')
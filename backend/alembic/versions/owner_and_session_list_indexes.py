@@ -0,0 +1,34 @@
+"""Add indexes for the domain list, session list and domain cascade
+
+Revision ID: owner_and_session_list_indexes
+Revises: users_email_lower_index
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'owner_and_session_list_indexes'
+down_revision = 'users_email_lower_index'
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ('ix_domain_configs_owner_updated', 'domain_configs', 'owner_user_id, updated_at'),
+    ('ix_chat_sessions_user_activity', 'chat_sessions', 'user_id, last_activity_at'),
+    ('ix_chat_sessions_domain', 'chat_sessions', 'domain_config_id'),
+]
+
+
+def upgrade():
+    """Create the list/cascade indexes without blocking writes."""
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} ({columns})")
+
+
+def downgrade():
+    """Drop the list/cascade indexes."""
+    with op.get_context().autocommit_block():
+        for name, _, _ in INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
@@ -0,0 +1,41 @@
+"""Index the domain and session lists on the owner column only
+
+Revision ID: owner_list_indexes_without_timestamps
+Revises: active_session_index_without_include
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'owner_list_indexes_without_timestamps'
+down_revision = 'active_session_index_without_include'
+branch_labels = None
+depends_on = None
+
+# (new index, old index, table, new columns, old columns)
+INDEXES = [
+    ('ix_domain_configs_owner', 'ix_domain_configs_owner_updated', 'domain_configs',
+     'owner_user_id', 'owner_user_id, updated_at'),
+    ('ix_chat_sessions_user', 'ix_chat_sessions_user_activity', 'chat_sessions',
+     'user_id', 'user_id, last_activity_at'),
+]
+
+
+def upgrade():
+    """Replace the (owner, timestamp) list indexes with owner-only ones."""
+    # updated_at/last_activity_at change on every write; keeping them out of
+    # indexes lets those writes be HOT updates. Per-owner lists are small
+    # enough to sort after the index lookup.
+    with op.get_context().autocommit_block():
+        for name, old_name, table, columns, _ in INDEXES:
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} ({columns})")
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {old_name}")
+
+
+def downgrade():
+    """Restore the (owner, timestamp) list indexes."""
+    with op.get_context().autocommit_block():
+        for name, old_name, table, _, old_columns in INDEXES:
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {old_name} ON {table} ({old_columns})")
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
@@ -0,0 +1,53 @@
+"""Use TIMESTAMPTZ columns with database-side defaults
+
+Revision ID: timestamptz_server_defaults
+Revises: node_call_logs_table
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'timestamptz_server_defaults'
+down_revision = 'node_call_logs_table'
+branch_labels = None
+depends_on = None
+
+# (table, column, server default)
+TIMESTAMP_COLUMNS = [
+    ('users', 'created_at', 'now()'),
+    ('domain_configs', 'created_at', 'now()'),
+    ('domain_configs', 'updated_at', 'now()'),
+    ('chat_sessions', 'created_at', 'now()'),
+    ('chat_sessions', 'last_activity_at', 'now()'),
+    ('chat_messages', 'created_at', 'clock_timestamp()'),
+    ('llm_usage_stats', 'last_updated', 'now()'),
+    ('node_call_logs', 'created_at', 'clock_timestamp()'),
+]
+
+
+def upgrade():
+    """Convert naive UTC timestamps to TIMESTAMPTZ and default them in the database."""
+    for table, column, default in TIMESTAMP_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.DateTime(timezone=True),
+            existing_nullable=False,
+            server_default=sa.text(default),
+            postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+        )
+
+
+def downgrade():
+    """Restore naive UTC timestamps without database defaults."""
+    for table, column, _ in TIMESTAMP_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.DateTime(),
+            existing_nullable=False,
+            server_default=None,
+            postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+        )
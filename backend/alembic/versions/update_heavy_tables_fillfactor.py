@@ -0,0 +1,33 @@
+"""Lower fillfactor on update-heavy tables
+
+Revision ID: update_heavy_tables_fillfactor
+Revises: chat_messages_session_created_index
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'update_heavy_tables_fillfactor'
+down_revision = 'chat_messages_session_created_index'
+branch_labels = None
+depends_on = None
+
+FILLFACTOR_TABLES = {
+    'chat_sessions': 85,
+    'domain_configs': 85,
+}
+
+
+def upgrade():
+    """Leave free space on each page so updated row versions stay on the same page."""
+    # Only pages written from now on honour the new fillfactor; run pg_repack
+    # (or VACUUM FULL in a maintenance window) to repack existing data.
+    for table, fillfactor in FILLFACTOR_TABLES.items():
+        op.execute(f"ALTER TABLE {table} SET (fillfactor = {fillfactor})")
+
+
+def downgrade():
+    """Restore the default fillfactor."""
+    for table in FILLFACTOR_TABLES:
+        op.execute(f"ALTER TABLE {table} RESET (fillfactor)")
@@ -0,0 +1,29 @@
+"""Add covering lower(email) index for login lookups
+
+Revision ID: users_email_lower_index
+Revises: update_heavy_tables_fillfactor
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'users_email_lower_index'
+down_revision = 'update_heavy_tables_fillfactor'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create the functional email index without blocking writes."""
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_email_lower "
+            "ON users (lower(email)) INCLUDE (id, password_hash)"
+        )
+
+
+def downgrade():
+    """Drop the functional email index."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_users_email_lower")
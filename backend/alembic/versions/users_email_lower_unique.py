@@ -0,0 +1,58 @@
+"""Make the lower(email) index unique and drop the plain email indexes
+
+Revision ID: users_email_lower_unique
+Revises: owner_and_session_list_indexes
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'users_email_lower_unique'
+down_revision = 'owner_and_session_list_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Make ix_users_email_lower unique and drop the exact-case email indexes it supersedes."""
+    conn = op.get_bind()
+    duplicates = conn.execute(sa.text(
+        "SELECT lower(email) FROM users GROUP BY lower(email) HAVING count(*) > 1 LIMIT 5"
+    )).scalars().all()
+    if duplicates:
+        raise RuntimeError(
+            "Cannot make emails case-insensitively unique; merge these accounts first: "
+            + ", ".join(duplicates)
+        )
+
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS ix_users_email_lower_unique "
+            "ON users (lower(email)) INCLUDE (id, password_hash)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_users_email_lower")
+        op.execute("ALTER INDEX ix_users_email_lower_unique RENAME TO ix_users_email_lower")
+
+    # lower(email) uniqueness implies exact-case uniqueness, and lookups go
+    # through lower(email), so these only cost index maintenance on insert
+    op.execute("ALTER TABLE users DROP CONSTRAINT IF EXISTS users_email_key")
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_users_email")
+
+
+def downgrade():
+    """Restore the plain email indexes and the non-unique lower(email) index."""
+    with op.get_context().autocommit_block():
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_email ON users (email)")
+        op.execute("CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS users_email_key ON users (email)")
+    op.execute("ALTER TABLE users ADD CONSTRAINT users_email_key UNIQUE USING INDEX users_email_key")
+
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_email_lower_plain "
+            "ON users (lower(email)) INCLUDE (id, password_hash)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_users_email_lower")
+        op.execute("ALTER INDEX ix_users_email_lower_plain RENAME TO ix_users_email_lower")
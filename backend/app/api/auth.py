@@ -23,7 +23,7 @@ async def signup(user_data: UserCreate, db: Session = Depends(get_db)):
         Created user
     """
     user = AuthService.create_user(db, user_data)
-    return user
+    return AuthService.to_user_response(user)
 
 
 @router.post("/login", response_model=Token)
@@ -75,4 +75,4 @@ async def get_current_user_info(current_user: User = Depends(get_current_user)):
     Returns:
         User information
     """
-    return current_user
+    return AuthService.to_user_response(current_user)
@@ -107,7 +107,7 @@ async def send_message(
     Returns:
         Chat response from assistant
     """
-    response = ChatService.send_message(db, session_id, message_data, current_user)
+    response = await ChatService.send_message(db, session_id, message_data, current_user)
     return response
 
 
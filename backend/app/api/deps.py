@@ -3,7 +3,9 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 from app.database import get_db
+from typing import Union
 from app.models.user import User
+from app.schemas.user import CachedUser
 from app.services.auth_service import AuthService
 from app.utils.security import decode_access_token
 
@@ -14,10 +16,13 @@ security = HTTPBearer()
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db)
-) -> User:
+) -> Union[User, CachedUser]:
     """
     Dependency to get the current authenticated user from JWT token.
     
+    The result may be a read-only CachedUser (see AuthService.get_user_by_id);
+    routes only read its id, email and created_at.
+    
     Args:
         credentials: HTTP Bearer credentials
         db: Database session
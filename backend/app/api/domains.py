@@ -1,5 +1,5 @@
 """Domain configuration API endpoints."""
-from fastapi import APIRouter, Depends, HTTPException, status, File, UploadFile, Form
+from fastapi import APIRouter, Depends, status, File, UploadFile, Form, Response
 from sqlalchemy.orm import Session
 from typing import List
 from uuid import UUID
@@ -8,15 +8,27 @@ from app.schemas.domain import (
     DomainConfigCreate,
     DomainConfigUpdate,
     DomainConfigResponse,
-    DomainConfigList
+    DomainConfigList,
+    DOMAIN_LIST_ADAPTER
 )
 from app.services.domain_service import DomainService
+from app.services import domain_config_cache
 from app.services.validation_service import ValidationService
 from app.api.deps import get_current_user
 from app.models.user import User
 
 router = APIRouter()
 
+
+def _json_response(content: bytes, status_code: int = status.HTTP_200_OK) -> Response:
+    """
+    Return pre-serialized JSON, skipping FastAPI's response_model re-validation.
+    
+    The response_model declarations are kept for the OpenAPI schema.
+    """
+    return Response(content=content, status_code=status_code, media_type="application/json")
+
+
 @router.get("", response_model=List[DomainConfigList])
 async def list_domains(
     current_user: User = Depends(get_current_user),
@@ -26,7 +38,8 @@ async def list_domains(
     Get all domains owned by the current user.
     """
     domains = DomainService.get_user_domains(db, current_user)
-    return domains
+    items = DOMAIN_LIST_ADAPTER.validate_python(domains, from_attributes=True)
+    return _json_response(DOMAIN_LIST_ADAPTER.dump_json(items))
 
 @router.post("", response_model=DomainConfigResponse, status_code=status.HTTP_201_CREATED)
 async def create_domain(
@@ -61,7 +74,8 @@ async def create_domain(
         pdf_file=pdf_bytes,
         filename=filename
     )
-    return domain
+    payload = DomainConfigResponse.model_validate(domain).to_json_bytes()
+    return _json_response(payload, status.HTTP_201_CREATED)
 
 
 @router.get("/{domain_id}", response_model=DomainConfigResponse)
@@ -81,8 +95,9 @@ async def get_domain(
     Returns:
         Domain configuration with full config_json
     """
-    domain = DomainService.get_domain_by_id(db, domain_id, current_user)
-    return domain
+    # Unchanged domains are served from the cached body keyed by updated_at
+    domain = DomainService.get_domain_by_id(db, domain_id, current_user, defer_config=True)
+    return _json_response(domain_config_cache.get_response_json(db, domain))
 
 
 @router.put("/{domain_id}", response_model=DomainConfigResponse)
@@ -109,7 +124,7 @@ async def update_domain(
         ValidationService.validate_config(domain_data.config_json)
     
     domain = DomainService.update_domain(db, domain_id, domain_data, current_user)
-    return domain
+    return _json_response(DomainConfigResponse.model_validate(domain).to_json_bytes())
 
 
 @router.delete("/{domain_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -3,16 +3,27 @@ from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.config import settings
+from app.utils import json_utils
 
 # Create SQLAlchemy engine
 engine = create_engine(
     settings.DATABASE_URL,
     pool_pre_ping=True,  # Verify connections before using
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,  # Drop connections before server/LB idle timeouts
     echo=settings.DEBUG,  # Log SQL queries in debug mode
+    executemany_mode="values_plus_batch",  # Multi-row INSERT / batched UPDATE for executemany
+    json_serializer=json_utils.dumps,  # orjson-backed JSONB encode/decode
+    json_deserializer=json_utils.loads,
 )
 
 # Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# expire_on_commit=False: committed objects keep their state, so returning
+# them does not trigger a reload SELECT. Server-generated columns are
+# fetched with RETURNING instead (eager_defaults on the mappers that need it).
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 
 # Base class for models
 Base = declarative_base()
@@ -11,8 +11,8 @@ from app.dp_chatbot_module.prompts import (
     INFO_QUERY_PROMPT,
     GENERAL_KNOWLEDGE_PROMPT
 )
-from app.schemas.patch import PatchOperation, PatchList
-from app.utils.patch_applier import apply_patch
+from app.schemas.patch import PatchOperation, PatchList, PATCH_LIST_ADAPTER
+from app.utils.patch_applier import apply_patches
 from app.services.validation_service import ValidationService
 import json
 
@@ -65,7 +65,12 @@ def _record_node_call(
     elapsed_ms: float,
     intent: str = None,
 ) -> List[Dict[str, Any]]:
-    """Return a new node_call_logs list with one entry appended."""
+    """
+    Return a new node_call_logs list with one entry appended.
+
+    node_name (and intent, when set) must have a code registered in
+    app.models.node_call_log, as they are persisted as SMALLINT codes.
+    """
     existing = list(state.get("node_call_logs") or [])
     existing.append({
         "node_name": node_name,
@@ -236,7 +241,7 @@ def generate_patch_node(state: AgentState) -> AgentState:
             )
             return {
                 **state,
-                "proposed_patch": patch_list.dict(),
+                "proposed_patch": patch_list.model_dump(),
                 "reasoning": patch_list.reasoning,
                 "node_call_logs": logs,
             }
@@ -257,13 +262,11 @@ def apply_patch_node(state: AgentState) -> AgentState:
 
     try:
         patch_list_data = state["proposed_patch"]
-        patch_list = PatchList(**patch_list_data)
+        patch_list = PATCH_LIST_ADAPTER.validate_python(patch_list_data)
 
-        current_config = state["current_config"]
-        for patch in patch_list.patches:
-            current_config = apply_patch(config=current_config, patch=patch)
+        updated_config = apply_patches(state["current_config"], patch_list.patches)
 
-        return {**state, "updated_config": current_config}
+        return {**state, "updated_config": updated_config}
     except ValueError as e:
         return {**state, "error_message": str(e)}
     except Exception as e:
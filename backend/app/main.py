@@ -1,4 +1,7 @@
 """Main FastAPI application."""
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from fastapi import FastAPI 
 from fastapi.middleware.cors import CORSMiddleware
 from app.config import settings
@@ -12,6 +15,18 @@ app = FastAPI(
     debug=settings.DEBUG,
 )
 
+# Application loggers ("app.*") only enqueue records; a listener thread
+# formats and writes them, so request handlers never block on stdio
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+_log_listener = QueueListener(_log_queue, _log_handler)
+
+_app_logger = logging.getLogger("app")
+_app_logger.setLevel(logging.DEBUG if settings.DEBUG else logging.INFO)
+_app_logger.addHandler(QueueHandler(_log_queue))
+_app_logger.propagate = False
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -25,6 +40,7 @@ app.add_middleware(
 @app.on_event("startup")
 async def startup_event():
     """Print startup banner."""
+    _log_listener.start()
     print("\n" + "="*60)
     print("🚀 Domain Pack Generator API Started")
     print("="*60)
@@ -37,6 +53,7 @@ async def shutdown_event():
     print("\n" + "="*60)
     print("🛑 Shutting Down")
     print("="*60)
+    _log_listener.stop()
 
 
 @app.get("/")
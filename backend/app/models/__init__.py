@@ -3,7 +3,7 @@ from app.models.user import User
 from app.models.domain_config import DomainConfig
 from app.models.chat_session import ChatSession
 from app.models.chat_message import ChatMessage
-from app.models.llm_usage import LLMUsage
+from app.models.llm_usage import LLMUsageEvent
 from app.models.node_call_log import NodeCallLog
 
-__all__ = ["User", "DomainConfig", "ChatSession", "ChatMessage", "LLMUsage", "NodeCallLog"]
+__all__ = ["User", "DomainConfig", "ChatSession", "ChatMessage", "LLMUsageEvent", "NodeCallLog"]
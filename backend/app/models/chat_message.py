@@ -1,11 +1,11 @@
 """Chat message model."""
-import uuid
-from datetime import datetime
-from sqlalchemy import Column, Text, DateTime, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID, ENUM
+from sqlalchemy import Column, Text, DateTime, ForeignKey, Index, func
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import enum
 from app.database import Base
+from app.utils.ids import uuid7
+from app.models.types import SmallIntEnum
 
 
 class MessageRole(str, enum.Enum):
@@ -15,22 +15,33 @@ class MessageRole(str, enum.Enum):
     SYSTEM = "system"
 
 
+# Stored SMALLINT codes; never renumber existing roles
+MESSAGE_ROLE_CODES = {
+    MessageRole.USER.value: 0,
+    MessageRole.ASSISTANT.value: 1,
+    MessageRole.SYSTEM.value: 2,
+}
+
+
 class ChatMessage(Base):
     """Chat message model for conversation history."""
     
     __tablename__ = "chat_messages"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     session_id = Column(UUID(as_uuid=True), ForeignKey("chat_sessions.id", ondelete="CASCADE"), nullable=False)
-    role = Column(
-        ENUM(MessageRole, name='message_role', create_type=False, native_enum=True, values_callable=lambda x: [e.value for e in x]),
-        nullable=False
-    )
+    role = Column(SmallIntEnum(MessageRole, MESSAGE_ROLE_CODES), nullable=False)
     message = Column(Text, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    # clock_timestamp() rather than now(): rows written in one transaction keep insertion order
+    created_at = Column(DateTime(timezone=True), server_default=func.clock_timestamp(), nullable=False)
     
     # Relationships
     session = relationship("ChatSession", back_populates="messages")
     
+    __table_args__ = (
+        # Serves ChatSession.messages ordering and the last-K history query as range scans
+        Index("ix_chat_messages_session_created", "session_id", "created_at"),
+    )
+    
     def __repr__(self):
         return f"<ChatMessage(id={self.id}, session_id={self.session_id}, role={self.role})>"
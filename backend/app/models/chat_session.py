@@ -1,11 +1,10 @@
 """Chat session model."""
-import uuid
-from datetime import datetime
-from sqlalchemy import Column, String, DateTime, ForeignKey, Index, Integer
-from sqlalchemy.dialects.postgresql import UUID, ENUM, JSONB
+from sqlalchemy import Column, String, DateTime, ForeignKey, Index, Integer, Enum, text, func
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 import enum
 from app.database import Base
+from app.utils.ids import uuid7
 
 
 class SessionStatus(str, enum.Enum):
@@ -19,16 +18,18 @@ class ChatSession(Base):
     
     __tablename__ = "chat_sessions"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     domain_config_id = Column(UUID(as_uuid=True), ForeignKey("domain_configs.id", ondelete="CASCADE"), nullable=False)
+    # VARCHAR + CHECK constraint instead of a native ENUM type
     status = Column(
-        ENUM(SessionStatus, name='session_status', create_type=False, native_enum=True, values_callable=lambda x: [e.value for e in x]),
+        Enum(SessionStatus, name='ck_chat_sessions_status', native_enum=False, create_constraint=True, length=16, values_callable=lambda x: [e.value for e in x]),
         default=SessionStatus.ACTIVE, 
+        server_default=SessionStatus.ACTIVE.value,
         nullable=False
     )
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    last_activity_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    last_activity_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     session_metadata = Column(JSONB, default=dict, nullable=False)  # Renamed from 'metadata' to avoid SQLAlchemy conflict
     total_llm_calls = Column(Integer, default=0, nullable=False)
     total_input_tokens = Column(Integer, default=0, nullable=False)
@@ -39,15 +40,29 @@ class ChatSession(Base):
     # Relationships
     user = relationship("User", back_populates="chat_sessions")
     domain_config = relationship("DomainConfig", back_populates="chat_sessions")
-    messages = relationship("ChatMessage", back_populates="session", cascade="all, delete-orphan", order_by="ChatMessage.created_at")
+    messages = relationship("ChatMessage", back_populates="session", cascade="all, delete-orphan", order_by="[ChatMessage.created_at, ChatMessage.id]", passive_deletes=True)
     
-    # Partial unique index: Only one active session per user+domain
+    # Table is created with fillfactor=85 (see update_heavy_tables_fillfactor migration)
+    # Partial unique index: Only one active session per user+domain.
     __table_args__ = (
         Index('uq_user_domain_active_session', 
               'user_id', 'domain_config_id',
               unique=True,
-              postgresql_where=(status == SessionStatus.ACTIVE)),
+              postgresql_where=text("status = 'active'")),
+        # Containment-only GIN index; filter with @> (not ->/->>) so it is used
+        Index('ix_chat_sessions_metadata_gin',
+              'session_metadata',
+              postgresql_using='gin',
+              postgresql_ops={'session_metadata': 'jsonb_path_ops'}),
+        # Per-user session list; the few rows are sorted by activity after
+        # the lookup, keeping last_activity_at out of indexes (HOT updates)
+        Index('ix_chat_sessions_user', 'user_id'),
+        # Lets domain deletes find their sessions without a sequential scan
+        Index('ix_chat_sessions_domain', 'domain_config_id'),
     )
     
+    # Fetch server-side defaults/onupdate/computed values via RETURNING on flush
+    __mapper_args__ = {"eager_defaults": True}
+    
     def __repr__(self):
         return f"<ChatSession(id={self.id}, user_id={self.user_id}, domain_id={self.domain_config_id}, status={self.status})>"
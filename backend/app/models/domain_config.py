@@ -1,10 +1,18 @@
 """Domain configuration model."""
-import uuid
-from datetime import datetime
-from sqlalchemy import Column, String, Text, Integer, DateTime, ForeignKey
+from sqlalchemy import Column, String, Text, Integer, DateTime, ForeignKey, Index, Computed, func
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from app.database import Base
+from app.utils.ids import uuid7
+
+
+def _count_sql(key: str) -> str:
+    """Array length of config_json->key; 0 when missing or not an array."""
+    # jsonb_array_length raises on null/object/scalar values
+    return (
+        f"CASE WHEN jsonb_typeof(config_json->'{key}') = 'array' "
+        f"THEN jsonb_array_length(config_json->'{key}') ELSE 0 END"
+    )
 
 
 class DomainConfig(Base):
@@ -12,47 +20,48 @@ class DomainConfig(Base):
     
     __tablename__ = "domain_configs"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     owner_user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     name = Column(String(255), nullable=False)
     description = Column(Text)
     version = Column(String(50), default="1.0.0", nullable=False)
     config_json = Column(JSONB, nullable=False)
     
-    # Cached counts for performance
-    entity_count = Column(Integer, default=0, nullable=False)
-    relationship_count = Column(Integer, default=0, nullable=False)
-    extraction_pattern_count = Column(Integer, default=0, nullable=False)
-    key_term_count = Column(Integer, default=0, nullable=False)
+    # Cached counts, maintained by PostgreSQL as stored generated columns
+    entity_count = Column(Integer, Computed(_count_sql("entities"), persisted=True), nullable=False)
+    relationship_count = Column(Integer, Computed(_count_sql("relationships"), persisted=True), nullable=False)
+    extraction_pattern_count = Column(Integer, Computed(_count_sql("extraction_patterns"), persisted=True), nullable=False)
+    key_term_count = Column(Integer, Computed(_count_sql("key_terms"), persisted=True), nullable=False)
     
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     
     # Relationships
     owner = relationship("User", back_populates="domain_configs")
-    chat_sessions = relationship("ChatSession", back_populates="domain_config", cascade="all, delete-orphan")
+    chat_sessions = relationship("ChatSession", back_populates="domain_config", cascade="all, delete-orphan", passive_deletes=True)
+    
+    # Table is created with fillfactor=85 (see update_heavy_tables_fillfactor migration)
+    __table_args__ = (
+        # Containment-only GIN index; filter with @> (not ->/->>) so it is used
+        Index('ix_domain_configs_config_gin',
+              'config_json',
+              postgresql_using='gin',
+              postgresql_ops={'config_json': 'jsonb_path_ops'}),
+        # Per-owner domain list; the few rows are sorted by updated_at after
+        # the lookup
+        Index('ix_domain_configs_owner', 'owner_user_id'),
+    )
+    
+    # Fetch server-side defaults/onupdate/computed values via RETURNING on flush
+    __mapper_args__ = {"eager_defaults": True}
     
     def __repr__(self):
         return f"<DomainConfig(id={self.id}, name={self.name}, owner_id={self.owner_user_id})>"
     
-    def update_counts(self):
-        """Alias for sync_from_config to maintain compatibility with chat service."""
-        return self.sync_from_config()
-    
     def sync_from_config(self):
-        """Sync top-level fields and cached counts from config_json."""
+        """Sync top-level fields from config_json (counts are generated by the database)."""
         if self.config_json is None:
-            self.entity_count = 0
-            self.relationship_count = 0
-            self.extraction_pattern_count = 0
-            self.key_term_count = 0
             return
-            
-        # Extract counts
-        self.entity_count = len(self.config_json.get("entities", []))
-        self.relationship_count = len(self.config_json.get("relationships", []))
-        self.extraction_pattern_count = len(self.config_json.get("extraction_patterns", []))
-        self.key_term_count = len(self.config_json.get("key_terms", []))
         
         # Extract metadata if present in config_json
         # Only update if the values in config_json are not empty/null
@@ -1,21 +1,24 @@
 """Global LLM usage statistics model."""
-import uuid
-from datetime import datetime
-from sqlalchemy import Column, Integer, DateTime
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, Integer, BigInteger, DateTime, Identity, func
 from app.database import Base
 
 
-class LLMUsage(Base):
-    """Global LLM usage tracking."""
+class LLMUsageEvent(Base):
+    """
+    Append-only log of LLM usage, one row per chat turn.
     
-    __tablename__ = "llm_usage_stats"
+    Writers only ever INSERT, so concurrent turns never contend on a shared
+    counter row. Global totals are read from the ``llm_usage_stats`` view,
+    which sums this table.
+    """
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    total_calls = Column(Integer, default=0, nullable=False)
-    total_input_tokens = Column(Integer, default=0, nullable=False)
-    total_output_tokens = Column(Integer, default=0, nullable=False)
-    last_updated = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    __tablename__ = "llm_usage_events"
+    
+    id = Column(BigInteger, Identity(always=True), primary_key=True)
+    calls = Column(Integer, default=0, nullable=False)
+    input_tokens = Column(Integer, default=0, nullable=False)
+    output_tokens = Column(Integer, default=0, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     
     def __repr__(self):
-        return f"<LLMUsage(calls={self.total_calls}, input={self.total_input_tokens}, output={self.total_output_tokens})>"
+        return f"<LLMUsageEvent(calls={self.calls}, input={self.input_tokens}, output={self.output_tokens})>"
@@ -1,9 +1,28 @@
 """Per-node LLM call log model."""
-import uuid
-from datetime import datetime
-from sqlalchemy import Column, String, Integer, Float, DateTime, ForeignKey, Index
+from sqlalchemy import Column, Integer, Float, DateTime, ForeignKey, Index, func
 from sqlalchemy.dialects.postgresql import UUID
 from app.database import Base
+from app.utils.ids import uuid7
+from app.models.types import SmallIntCode
+
+# Stored SMALLINT codes; append new names, never renumber existing ones
+NODE_NAME_CODES = {
+    "classify_intent": 1,
+    "generate_patch": 2,
+    "generate_response_error": 3,
+    "generate_response_info": 4,
+    "general_knowledge": 5,
+}
+
+INTENT_CODES = {
+    "domain_operation": 1,
+    "entity_operation": 2,
+    "relationship_operation": 3,
+    "extraction_pattern_operation": 4,
+    "key_term_operation": 5,
+    "info_query": 6,
+    "general_query": 7,
+}
 
 
 class NodeCallLog(Base):
@@ -11,23 +30,29 @@ class NodeCallLog(Base):
 
     __tablename__ = "node_call_logs"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     session_id = Column(
         UUID(as_uuid=True),
         ForeignKey("chat_sessions.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     turn = Column(Integer, nullable=False, default=0)        # Which user-message turn
-    node_name = Column(String, nullable=False)                # e.g. "classify_intent"
+    node_name = Column(SmallIntCode(NODE_NAME_CODES), nullable=False)  # e.g. "classify_intent"
     input_tokens = Column(Integer, nullable=False, default=0)
     output_tokens = Column(Integer, nullable=False, default=0)
     response_time_ms = Column(Float, nullable=False, default=0.0)
-    intent = Column(String, nullable=True)                   # Only set for classify_intent node
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    intent = Column(SmallIntCode(INTENT_CODES), nullable=True)         # Only set for classify_intent node
+    # clock_timestamp() rather than now(): rows written in one transaction keep insertion order
+    created_at = Column(DateTime(timezone=True), server_default=func.clock_timestamp(), nullable=False)
 
     __table_args__ = (
         Index("ix_node_call_logs_session_turn", "session_id", "turn"),
+        # Covers per-session token/latency aggregates with an index-only scan
+        Index(
+            "ix_node_call_logs_session_tokens",
+            "session_id",
+            postgresql_include=["input_tokens", "output_tokens", "response_time_ms"],
+        ),
     )
 
     def __repr__(self):
@@ -0,0 +1,54 @@
+"""Custom column types shared by the models."""
+import enum
+from typing import Dict, Type
+from sqlalchemy import SmallInteger
+from sqlalchemy.types import TypeDecorator
+
+
+class SmallIntCode(TypeDecorator):
+    """
+    Store a string from a closed vocabulary as a SMALLINT code.
+
+    Codes are part of the on-disk format, so existing entries must never be
+    renumbered; new values are appended with a fresh code.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, codes: Dict[str, int]):
+        super().__init__()
+        # Kept as a tuple so the type stays hashable for the statement cache
+        self.codes = tuple(codes.items())
+        self._to_code = dict(codes)
+        self._from_code = {code: value for value, code in codes.items()}
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        key = getattr(value, "value", value)
+        try:
+            return self._to_code[key]
+        except KeyError:
+            raise ValueError(f"No SMALLINT code registered for {key!r}") from None
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return self._from_code[value]
+
+
+class SmallIntEnum(SmallIntCode):
+    """
+    Store a string enum as a SMALLINT code.
+
+    The Python side keeps working with the enum members; only the stored
+    representation changes.
+    """
+
+    cache_ok = True
+
+    def __init__(self, enum_class: Type[enum.Enum], codes: Dict[str, int]):
+        super().__init__(codes)
+        self.enum_class = enum_class
+        self._from_code = {code: enum_class(value) for value, code in codes.items()}
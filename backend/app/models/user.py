@@ -1,10 +1,9 @@
 """User model for authentication and ownership."""
-import uuid
-from datetime import datetime
-from sqlalchemy import Column, String, DateTime
+from sqlalchemy import Column, String, DateTime, Index, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from app.database import Base
+from app.utils.ids import uuid7
 
 
 class User(Base):
@@ -12,14 +11,23 @@ class User(Base):
     
     __tablename__ = "users"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    email = Column(String(255), unique=True, nullable=False, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    email = Column(String(255), nullable=False)
     password_hash = Column(String, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     
     # Relationships
-    domain_configs = relationship("DomainConfig", back_populates="owner", cascade="all, delete-orphan")
-    chat_sessions = relationship("ChatSession", back_populates="user", cascade="all, delete-orphan")
+    domain_configs = relationship("DomainConfig", back_populates="owner", cascade="all, delete-orphan", passive_deletes=True)
+    chat_sessions = relationship("ChatSession", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    
+    __table_args__ = (
+        # Case-insensitive login lookup and uniqueness; INCLUDE makes it an
+        # index-only scan
+        Index('ix_users_email_lower',
+              func.lower(email),
+              unique=True,
+              postgresql_include=['id', 'password_hash']),
+    )
     
     def __repr__(self):
         return f"<User(id={self.id}, email={self.email})>"
@@ -1,5 +1,6 @@
 """Chat schemas for chatbot interaction."""
-from pydantic import BaseModel, UUID4
+from pydantic import BaseModel, ConfigDict
+from uuid import UUID
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 from app.models.chat_session import SessionStatus
@@ -8,14 +9,14 @@ from app.models.chat_message import MessageRole
 
 class ChatSessionCreate(BaseModel):
     """Schema for creating a chat session."""
-    domain_config_id: UUID4
+    domain_config_id: UUID
 
 
 class ChatSessionResponse(BaseModel):
     """Schema for chat session response."""
-    id: UUID4
-    user_id: UUID4
-    domain_config_id: UUID4
+    id: UUID
+    user_id: UUID
+    domain_config_id: UUID
     status: SessionStatus
     created_at: datetime
     last_activity_at: datetime
@@ -24,8 +25,7 @@ class ChatSessionResponse(BaseModel):
     total_output_tokens: int = 0
     session_metadata: Dict[str, Any] = {}
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class ChatMessageCreate(BaseModel):
@@ -36,14 +36,13 @@ class ChatMessageCreate(BaseModel):
 
 class ChatMessageResponse(BaseModel):
     """Schema for chat message response."""
-    id: UUID4
-    session_id: UUID4
+    id: UUID
+    session_id: UUID
     role: MessageRole
     message: str
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class ChatRequest(BaseModel):
@@ -68,14 +67,13 @@ class ChatSessionStats(BaseModel):
     total_input_tokens: int = 0
     total_output_tokens: int = 0
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class NodeCallLogResponse(BaseModel):
     """Schema for a single per-node LLM call log entry."""
-    id: UUID4
-    session_id: UUID4
+    id: UUID
+    session_id: UUID
     turn: int
     node_name: str
     input_tokens: int
@@ -84,5 +82,4 @@ class NodeCallLogResponse(BaseModel):
     intent: Optional[str] = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
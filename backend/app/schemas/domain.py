@@ -1,5 +1,6 @@
 """Domain configuration schemas."""
-from pydantic import BaseModel, UUID4, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+from uuid import UUID
 from datetime import datetime
 from typing import List, Optional, Dict, Any, Union
 
@@ -9,6 +10,8 @@ class AttributeSchema(BaseModel):
     name: str = Field(..., description="The name of the attribute (e.g. 'title')")
     description: str = Field(..., description="Description of what this attribute represents")
     examples: List[str] = Field(default_factory=list, description="Realistic examples of the attribute value")
+    
+    model_config = ConfigDict(frozen=True)
 
 
 class EntitySchema(BaseModel):
@@ -18,6 +21,9 @@ class EntitySchema(BaseModel):
     description: str = Field(..., description="Description of the entity")
     attributes: List[AttributeSchema] = Field(default_factory=list)
     synonyms: List[str] = Field(default_factory=list)
+    
+    # Only the generation path needs this schema; build it on first use
+    model_config = ConfigDict(defer_build=True)
 
 
 class RelationshipAttributeSchema(BaseModel):
@@ -25,6 +31,8 @@ class RelationshipAttributeSchema(BaseModel):
     name: str = Field(..., description="Name of the attribute")
     description: str = Field(..., description="Description of the attribute")
     examples: List[str] = Field(default_factory=list, description="Realistic examples")
+    
+    model_config = ConfigDict(frozen=True)
 
 
 class RelationshipSchema(BaseModel):
@@ -35,8 +43,7 @@ class RelationshipSchema(BaseModel):
     description: str = Field(..., description="Description of the relationship")
     attributes: List[RelationshipAttributeSchema] = Field(default_factory=list)
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
 
 
 class ExtractionPatternSchema(BaseModel):
@@ -57,6 +64,8 @@ class DomainConfigSchema(BaseModel):
     relationships: List[RelationshipSchema] = Field(default_factory=list)
     extraction_patterns: List[ExtractionPatternSchema] = Field(default_factory=list)
     key_terms: List[str] = Field(default_factory=list)
+    
+    model_config = ConfigDict(defer_build=True)
 
 
 class DomainConfigCreate(BaseModel):
@@ -76,8 +85,8 @@ class DomainConfigUpdate(BaseModel):
 
 class DomainConfigResponse(BaseModel):
     """Schema for domain config response."""
-    id: UUID4
-    owner_user_id: UUID4
+    id: UUID
+    owner_user_id: UUID
     name: str
     description: Optional[str]
     version: str
@@ -89,13 +98,16 @@ class DomainConfigResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+    
+    def to_json_bytes(self) -> bytes:
+        """Serialize straight to JSON bytes in pydantic-core."""
+        return self.__pydantic_serializer__.to_json(self)
 
 
 class DomainConfigList(BaseModel):
     """Schema for domain config list item."""
-    id: UUID4
+    id: UUID
     name: str
     description: Optional[str]
     version: str
@@ -105,5 +117,8 @@ class DomainConfigList(BaseModel):
     key_term_count: int
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+# Built once at import; serializes list rows without per-item model instances
+DOMAIN_LIST_ADAPTER = TypeAdapter(List[DomainConfigList])
@@ -1,5 +1,6 @@
-from pydantic import BaseModel, Field, ConfigDict
-from typing import Literal, Optional, List, Union
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter
+from enum import Enum
+from typing import Optional, List, Union
 
 class StrictAttributeSchema(BaseModel):
     """Strict attribute schema for OpenAI compat."""
@@ -31,71 +32,74 @@ class StrictPayloadSchema(BaseModel):
     
     model_config = ConfigDict(extra="forbid", populate_by_name=True)
 
+class PatchOp(str, Enum):
+    """Patch operation types (serialized as their string values)."""
+    
+    # Domain-level operations
+    UPDATE_DOMAIN_NAME = "update_domain_name"
+    UPDATE_DOMAIN_DESCRIPTION = "update_domain_description"
+    UPDATE_DOMAIN_VERSION = "update_domain_version"
+    
+    # Entity operations
+    ADD_ENTITY = "add_entity"
+    UPDATE_ENTITY_NAME = "update_entity_name"
+    UPDATE_ENTITY_TYPE = "update_entity_type"
+    UPDATE_ENTITY_DESCRIPTION = "update_entity_description"
+    DELETE_ENTITY = "delete_entity"
+    
+    # Entity attribute operations
+    ADD_ENTITY_ATTRIBUTE = "add_entity_attribute"
+    UPDATE_ENTITY_ATTRIBUTE_NAME = "update_entity_attribute_name"
+    UPDATE_ENTITY_ATTRIBUTE_DESCRIPTION = "update_entity_attribute_description"
+    DELETE_ENTITY_ATTRIBUTE = "delete_entity_attribute"
+    
+    # Entity attribute examples operations (array)
+    ADD_ENTITY_ATTRIBUTE_EXAMPLE = "add_entity_attribute_example"
+    UPDATE_ENTITY_ATTRIBUTE_EXAMPLE = "update_entity_attribute_example"
+    DELETE_ENTITY_ATTRIBUTE_EXAMPLE = "delete_entity_attribute_example"
+    
+    # Entity synonyms operations (array)
+    ADD_ENTITY_SYNONYM = "add_entity_synonym"
+    UPDATE_ENTITY_SYNONYM = "update_entity_synonym"
+    DELETE_ENTITY_SYNONYM = "delete_entity_synonym"
+    
+    # Relationship operations
+    ADD_RELATIONSHIP = "add_relationship"
+    UPDATE_RELATIONSHIP_NAME = "update_relationship_name"
+    UPDATE_RELATIONSHIP_FROM = "update_relationship_from"
+    UPDATE_RELATIONSHIP_TO = "update_relationship_to"
+    UPDATE_RELATIONSHIP_DESCRIPTION = "update_relationship_description"
+    DELETE_RELATIONSHIP = "delete_relationship"
+    
+    # Relationship attribute operations
+    ADD_RELATIONSHIP_ATTRIBUTE = "add_relationship_attribute"
+    UPDATE_RELATIONSHIP_ATTRIBUTE_NAME = "update_relationship_attribute_name"
+    UPDATE_RELATIONSHIP_ATTRIBUTE_DESCRIPTION = "update_relationship_attribute_description"
+    DELETE_RELATIONSHIP_ATTRIBUTE = "delete_relationship_attribute"
+    
+    # Relationship attribute examples operations (array)
+    ADD_RELATIONSHIP_ATTRIBUTE_EXAMPLE = "add_relationship_attribute_example"
+    UPDATE_RELATIONSHIP_ATTRIBUTE_EXAMPLE = "update_relationship_attribute_example"
+    DELETE_RELATIONSHIP_ATTRIBUTE_EXAMPLE = "delete_relationship_attribute_example"
+    
+    # Extraction pattern operations
+    ADD_EXTRACTION_PATTERN = "add_extraction_pattern"
+    UPDATE_EXTRACTION_PATTERN_PATTERN = "update_extraction_pattern_pattern"
+    UPDATE_EXTRACTION_PATTERN_ENTITY_TYPE = "update_extraction_pattern_entity_type"
+    UPDATE_EXTRACTION_PATTERN_ATTRIBUTE = "update_extraction_pattern_attribute"
+    UPDATE_EXTRACTION_PATTERN_EXTRACT_FULL_MATCH = "update_extraction_pattern_extract_full_match"
+    UPDATE_EXTRACTION_PATTERN_CONFIDENCE = "update_extraction_pattern_confidence"
+    DELETE_EXTRACTION_PATTERN = "delete_extraction_pattern"
+    
+    # Key terms operations (array)
+    ADD_KEY_TERM = "add_key_term"
+    UPDATE_KEY_TERM = "update_key_term"
+    DELETE_KEY_TERM = "delete_key_term"
+
 class PatchOperation(BaseModel):
     """Structured patch operation from LLM supporting hierarchical edits."""
     
-    operation: Literal[
-        # Domain-level operations
-        "update_domain_name",
-        "update_domain_description",
-        "update_domain_version",
-        
-        # Entity operations
-        "add_entity",
-        "update_entity_name",
-        "update_entity_type",
-        "update_entity_description",
-        "delete_entity",
-        
-        # Entity attribute operations
-        "add_entity_attribute",
-        "update_entity_attribute_name",
-        "update_entity_attribute_description",
-        "delete_entity_attribute",
-        
-        # Entity attribute examples operations (array)
-        "add_entity_attribute_example",
-        "update_entity_attribute_example",
-        "delete_entity_attribute_example",
-        
-        # Entity synonyms operations (array)
-        "add_entity_synonym",
-        "update_entity_synonym",
-        "delete_entity_synonym",
-        
-        # Relationship operations
-        "add_relationship",
-        "update_relationship_name",
-        "update_relationship_from",
-        "update_relationship_to",
-        "update_relationship_description",
-        "delete_relationship",
-        
-        # Relationship attribute operations
-        "add_relationship_attribute",
-        "update_relationship_attribute_name",
-        "update_relationship_attribute_description",
-        "delete_relationship_attribute",
-        
-        # Relationship attribute examples operations (array)
-        "add_relationship_attribute_example",
-        "update_relationship_attribute_example",
-        "delete_relationship_attribute_example",
-        
-        # Extraction pattern operations
-        "add_extraction_pattern",
-        "update_extraction_pattern_pattern",
-        "update_extraction_pattern_entity_type",
-        "update_extraction_pattern_attribute",
-        "update_extraction_pattern_extract_full_match",
-        "update_extraction_pattern_confidence",
-        "delete_extraction_pattern",
-        
-        # Key terms operations (array)
-        "add_key_term",
-        "update_key_term",
-        "delete_key_term"
-    ] = Field(..., alias="type", description="Type of operation to perform")
+    operation: PatchOp = Field(..., alias="type", description="Type of operation to perform")
     
     target_name: Optional[str] = Field(
         default=None, 
@@ -130,6 +134,8 @@ class PatchOperation(BaseModel):
     model_config = ConfigDict(
         extra="forbid",
         populate_by_name=True,
+        # Validate against PatchOp, but keep the plain string so dumps stay JSON-ready
+        use_enum_values=True,
         json_schema_extra={
             "examples": [
                 {
@@ -192,3 +198,6 @@ class PatchList(BaseModel):
             ]
         }
     )
+
+# Built once at import; reuse instead of constructing PatchList(**data) per call
+PATCH_LIST_ADAPTER = TypeAdapter(PatchList)
@@ -1,5 +1,7 @@
 """User schemas for authentication."""
-from pydantic import BaseModel, EmailStr, UUID4
+from dataclasses import dataclass
+from pydantic import BaseModel, EmailStr
+from uuid import UUID
 from datetime import datetime
 from typing import Optional
 
@@ -18,7 +20,7 @@ class UserLogin(BaseModel):
 
 class UserResponse(BaseModel):
     """Schema for user response."""
-    id: UUID4
+    id: UUID
     email: EmailStr
     created_at: datetime
     
@@ -32,7 +34,16 @@ class Token(BaseModel):
     token_type: str = "bearer"
 
 
-class TokenData(BaseModel):
-    """Schema for token payload data."""
-    user_id: Optional[UUID4] = None
+@dataclass(slots=True, frozen=True)
+class TokenData:
+    """Token payload data (built from verified claims, so not a pydantic model)."""
+    user_id: Optional[UUID] = None
     email: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
+class CachedUser:
+    """Read-only public user fields served from the user cache (not an ORM row)."""
+    id: UUID
+    email: str
+    created_at: datetime
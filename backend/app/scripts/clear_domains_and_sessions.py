@@ -15,21 +15,29 @@ from pathlib import Path
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+from sqlalchemy import delete, func, select
 from app.database import SessionLocal
 from app.models.domain_config import DomainConfig
 from app.models.chat_session import ChatSession
 from app.models.chat_message import ChatMessage
 
 
+def _counts(db) -> tuple:
+    """Count domains, sessions and messages in a single round trip."""
+    return tuple(db.execute(select(
+        select(func.count()).select_from(DomainConfig).scalar_subquery(),
+        select(func.count()).select_from(ChatSession).scalar_subquery(),
+        select(func.count()).select_from(ChatMessage).scalar_subquery(),
+    )).one())
+
+
 def clear_all_domains_and_sessions():
     """Delete all domain configurations and chat sessions from the database."""
     db = SessionLocal()
     
     try:
         # Count records before deletion
-        domain_count = db.query(DomainConfig).count()
-        session_count = db.query(ChatSession).count()
-        message_count = db.query(ChatMessage).count()
+        domain_count, session_count, message_count = _counts(db)
         
         print("\n" + "="*60)
         print("🗑️  Database Cleanup - Domains and Sessions")
@@ -47,16 +55,16 @@ def clear_all_domains_and_sessions():
         
         print("\n🔄 Deleting records...")
         
-        # Delete all domain configurations
+        # Delete all domain configurations with a single bare DELETE
         # This will cascade delete all chat_sessions and chat_messages
-        deleted_domains = db.query(DomainConfig).delete()
+        deleted_domains = db.execute(
+            delete(DomainConfig).execution_options(synchronize_session=False)
+        ).rowcount
         
         db.commit()
         
         # Verify deletion
-        remaining_domains = db.query(DomainConfig).count()
-        remaining_sessions = db.query(ChatSession).count()
-        remaining_messages = db.query(ChatMessage).count()
+        remaining_domains, remaining_sessions, remaining_messages = _counts(db)
         
         print("\n✅ Deletion complete!")
         print("\n📊 Results:")
@@ -1,10 +1,13 @@
 """Authentication service for user management."""
-from sqlalchemy.orm import Session
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, load_only, raiseload
 from fastapi import HTTPException, status
 from app.models.user import User
-from app.schemas.user import UserCreate, UserLogin
-from app.utils.security import get_password_hash, verify_password, create_access_token
-from typing import Optional
+from app.schemas.user import CachedUser, UserCreate, UserLogin, UserResponse
+from app.utils import user_cache
+from app.utils.security import get_password_hash, verify_password, create_access_token, encode_subject
+from typing import Optional, Union
 
 
 class AuthService:
@@ -25,9 +28,12 @@ class AuthService:
         Raises:
             HTTPException: If email already exists
         """
-        # Check if user exists
-        existing_user = db.query(User).filter(User.email == user_data.email).first()
-        if existing_user:
+        # Check if user exists; EXISTS is answered from ix_users_email_lower
+        # without building a User
+        email_taken = db.query(
+            db.query(User.id).filter(func.lower(User.email) == user_data.email.lower()).exists()
+        ).scalar()
+        if email_taken:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Email already registered"
@@ -41,13 +47,20 @@ class AuthService:
         )
         
         db.add(db_user)
-        db.commit()
-        db.refresh(db_user)
+        try:
+            db.commit()
+        except IntegrityError:
+            # Lost a race with a concurrent signup for the same email
+            db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Email already registered"
+            )
         
         return db_user
     
     @staticmethod
-    def authenticate_user(db: Session, user_data: UserLogin) -> Optional[User]:
+    def authenticate_user(db: Session, user_data: UserLogin) -> Optional[Union[User, CachedUser]]:
         """
         Authenticate a user with email and password.
         
@@ -58,26 +71,49 @@ class AuthService:
         Returns:
             User if authenticated, None otherwise
         """
-        user = db.query(User).filter(User.email == user_data.email).first()
+        # Login only needs the token claims and the hash
+        user = db.query(User).options(
+            load_only(User.id, User.email, User.password_hash),
+            raiseload("*")
+        ).filter(func.lower(User.email) == user_data.email.lower()).first()
         if not user:
             return None
+        
+        # Credentials verified against this same hash in the last minute
+        # skip the bcrypt check
+        cached_user_id = user_cache.get_login(user_data.email, user_data.password, user.password_hash)
+        if cached_user_id == str(user.id):
+            return user
+        
         if not verify_password(user_data.password, user.password_hash):
             return None
+        user_cache.set_login(user_data.email, user_data.password, user.password_hash, user.id)
         return user
     
     @staticmethod
-    def get_user_by_id(db: Session, user_id: str) -> Optional[User]:
+    def get_user_by_id(db: Session, user_id: str) -> Optional[Union[User, CachedUser]]:
         """
         Get user by ID.
         
+        On a cache hit this returns a read-only CachedUser (id, email,
+        created_at) rather than an ORM row; it is enough for request auth
+        but must not be added to or merged into a session.
+        
         Args:
             db: Database session
             user_id: User UUID
             
         Returns:
-            User if found, None otherwise
+            User or CachedUser if found, None otherwise
         """
-        return db.query(User).filter(User.id == user_id).first()
+        cached = user_cache.get_user(user_id)
+        if cached is not None:
+            return CachedUser(**cached)
+        
+        user = db.query(User).options(raiseload("*")).filter(User.id == user_id).first()
+        if user is not None:
+            user_cache.set_user(user)
+        return user
     
     @staticmethod
     def get_user_by_email(db: Session, email: str) -> Optional[User]:
@@ -91,7 +127,27 @@ class AuthService:
         Returns:
             User if found, None otherwise
         """
-        return db.query(User).filter(User.email == email).first()
+        return db.query(User).options(raiseload("*")).filter(func.lower(User.email) == email.lower()).first()
+    
+    @staticmethod
+    def to_user_response(user: User) -> UserResponse:
+        """
+        Build a UserResponse from a loaded User row.
+        
+        Uses model_construct because the values come straight from the
+        database; only use this for trusted rows, never for request input.
+        
+        Args:
+            user: User object
+            
+        Returns:
+            User response schema
+        """
+        return UserResponse.model_construct(
+            id=user.id,
+            email=user.email,
+            created_at=user.created_at
+        )
     
     @staticmethod
     def create_token_for_user(user: User) -> str:
@@ -105,7 +161,7 @@ class AuthService:
             JWT token string
         """
         token_data = {
-            "sub": str(user.id),
+            "sub": encode_subject(user.id),
             "email": user.email
         }
         return create_access_token(token_data)
@@ -1,9 +1,11 @@
 """Chat service for managing chat sessions and executing LangGraph."""
-from sqlalchemy.orm import Session
+import logging
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session, joinedload, raiseload
 from fastapi import HTTPException, status
-from typing import List, Dict, Any
+from typing import Final, List, Dict, Any
 from uuid import UUID
-from datetime import datetime
 from app.models.chat_session import ChatSession, SessionStatus
 from app.models.chat_message import ChatMessage, MessageRole
 from app.models.domain_config import DomainConfig
@@ -12,6 +14,26 @@ from app.schemas.chat import ChatRequest, ChatResponse
 from app.dp_chatbot_module.graph import domain_graph
 from app.dp_chatbot_module.state import create_initial_state
 from app.services.domain_service import DomainService
+from app.services import domain_config_cache
+
+logger = logging.getLogger(__name__)
+
+# Replies that confirm or cancel a pending patch
+_CONFIRM_WORDS = frozenset({"yes", "confirm", "y", "apply", "ok"})
+_CANCEL_WORDS = frozenset({"no", "cancel", "n", "reject", "abort"})
+
+# Fixed assistant texts
+_WELCOME_MESSAGE: Final[str] = (
+    "I'm your **Domain Pack AI Assistant**. I specialize in generating and maintaining "
+    "complex structures like entities, rules, and reasoning templates.\n\n"
+    "I've loaded your project context and I'm ready to help you enhance this domain pack. "
+    "What would you like to do?"
+)
+_RESPONSES: Final[Dict[str, str]] = {
+    "applied": "✅ Changes applied successfully!",
+    "applied_reply": "✅ Changes for the '{domain_name}' domain have been applied successfully!",
+    "cancelled": "❌ Changes cancelled. What would you like to do instead?",
+}
 
 
 class ChatService:
@@ -38,7 +60,7 @@ class ChatService:
             Chat session
         """
         # Check if active session exists
-        active_session = db.query(ChatSession).filter(
+        active_session = db.query(ChatSession).options(raiseload("*")).filter(
             ChatSession.user_id == user.id,
             ChatSession.domain_config_id == domain_config_id,
             ChatSession.status == SessionStatus.ACTIVE
@@ -47,8 +69,8 @@ class ChatService:
         if active_session:
             return active_session
         
-        # Verify domain exists and user owns it
-        domain = DomainService.get_domain_by_id(db, domain_config_id, user)
+        # Verify domain exists and user owns it; the document itself is not needed
+        DomainService.get_domain_by_id(db, domain_config_id, user, defer_config=True)
         
         # Create new session
         new_session = ChatSession(
@@ -57,17 +79,14 @@ class ChatService:
             status=SessionStatus.ACTIVE
         )
         
-        db.add(new_session)
-        db.commit()
-        db.refresh(new_session)
-        
-        # Add welcome message
+        # Add welcome message; linked through the relationship so both rows
+        # are inserted in one flush and committed together
         welcome_msg = ChatMessage(
-            session_id=new_session.id,
+            session=new_session,
             role=MessageRole.ASSISTANT,
-            message="I'm your **Domain Pack AI Assistant**. I specialize in generating and maintaining complex structures like entities, rules, and reasoning templates.\n\nI've loaded your project context and I'm ready to help you enhance this domain pack. What would you like to do?"
+            message=_WELCOME_MESSAGE
         )
-        db.add(welcome_msg)
+        db.add_all([new_session, welcome_msg])
         db.commit()
         
         return new_session
@@ -91,14 +110,19 @@ class ChatService:
         Returns:
             List of chat sessions
         """
-        return db.query(ChatSession).filter(
+        return db.query(ChatSession).options(raiseload("*")).filter(
             ChatSession.user_id == user.id
         ).order_by(
             ChatSession.last_activity_at.desc()
         ).limit(limit).offset(offset).all()
     
     @staticmethod
-    def get_session(db: Session, session_id: UUID, user: User) -> ChatSession:
+    def get_session(
+        db: Session,
+        session_id: UUID,
+        user: User,
+        load_domain: bool = False
+    ) -> ChatSession:
         """
         Get a chat session by ID.
         
@@ -106,6 +130,8 @@ class ChatService:
             db: Database session
             session_id: Session UUID
             user: Current user
+            load_domain: Also load session.domain_config (without config_json)
+                in the same query
             
         Returns:
             Chat session
@@ -113,7 +139,13 @@ class ChatService:
         Raises:
             HTTPException: If session not found or access denied
         """
-        session = db.query(ChatSession).filter(ChatSession.id == session_id).first()
+        # Relationships must be requested explicitly; lazy loads raise
+        query = db.query(ChatSession).options(raiseload("*"))
+        if load_domain:
+            query = query.options(
+                joinedload(ChatSession.domain_config).defer(DomainConfig.config_json)
+            )
+        session = query.filter(ChatSession.id == session_id).first()
         
         if not session:
             raise HTTPException(
@@ -158,7 +190,7 @@ class ChatService:
         db.commit()
     
     @staticmethod
-    def send_message(
+    async def send_message(
         db: Session,
         session_id: UUID,
         message_data: ChatRequest,
@@ -176,86 +208,119 @@ class ChatService:
         Returns:
             Chat response with assistant message
         """
-        # Get session
-        session = ChatService.get_session(db, session_id, user)
-        
-        # Update last activity
-        session.last_activity_at = datetime.utcnow()
+        # The turn's rows are written in one transaction: a single commit
+        # (one WAL flush) on success, no messages persisted on failure
+        try:
+            response = await ChatService._run_turn(db, session_id, message_data, user)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
         
-        # Get domain config
-        domain = DomainService.get_domain_by_id(db, session.domain_config_id, user)
+        return response
+    
+    @staticmethod
+    async def _run_turn(
+        db: Session,
+        session_id: UUID,
+        message_data: ChatRequest,
+        user: User
+    ) -> ChatResponse:
+        """
+        Stage all writes for one chat turn; the caller commits.
         
-        # Save user message
-        user_message = ChatMessage(
-            session_id=session_id,
-            role=MessageRole.USER,
-            message=message_data.message
-        )
-        db.add(user_message)
-        db.commit()
+        Before the graph runs, the read transaction is ended with nothing
+        staged, so the pooled connection is released for the duration of the
+        LLM calls; the Session checks a connection out again when the results
+        are written.
+        """
+        # Get session and its domain row (without config_json) in one query
+        session = ChatService.get_session(db, session_id, user, load_domain=True)
+        domain = session.domain_config
+        if domain.owner_user_id != user.id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Access denied"
+            )
         
-        # Get recent messages for context
-        recent_messages = db.query(ChatMessage).filter(
+        # The config document comes from the cache
+        config_json = domain_config_cache.get_config_json(db, domain.id, domain.updated_at)
+        
+        # Get recent history before the new message is added; the current
+        # message is already in hand, so only the earlier ones are fetched.
+        # Newest K-1 via the (session_id, created_at) index, re-ordered
+        # chronologically in SQL; id breaks created_at ties within a turn.
+        recent = select(
+            ChatMessage.id,
+            ChatMessage.role,
+            ChatMessage.message,
+            ChatMessage.created_at
+        ).where(
             ChatMessage.session_id == session_id
         ).order_by(
-            ChatMessage.created_at.desc()
-        ).limit(ChatService.CONTEXT_MESSAGE_COUNT).all()
-        
-        # Reverse to chronological order
-        recent_messages.reverse()
+            ChatMessage.created_at.desc(),
+            ChatMessage.id.desc()
+        ).limit(ChatService.CONTEXT_MESSAGE_COUNT - 1).subquery()
         
-        # Convert to dict format
         chat_history = [
-            {"role": msg.role.value, "content": msg.message}
-            for msg in recent_messages[:-1]  # Exclude the message we just added
+            {"role": role.value, "content": message}
+            for role, message in db.execute(
+                select(recent.c.role, recent.c.message).order_by(recent.c.created_at, recent.c.id)
+            )
         ]
         
+        # User message is written together with the reply by _save_exchange
+        user_message = ChatMessage(
+            session_id=session_id,
+            role=MessageRole.USER,
+            message=message_data.message
+        )
+        
         # Check if this is a confirmation response to a pending patch
         if session.session_metadata and session.session_metadata.get("pending_patch"):
             user_msg_lower = message_data.message.lower().strip()
             
-            if user_msg_lower in ["yes", "confirm", "y", "apply", "ok"]:
+            if user_msg_lower in _CONFIRM_WORDS:
                 # Apply pending patch
-                domain.config_json = session.session_metadata["pending_updated_config"]
+                config_json = session.session_metadata["pending_updated_config"]
+                domain.config_json = config_json
                 domain.sync_from_config()
                 session.session_metadata = {}
-                db.commit()
+                session.last_activity_at = func.now()
                 
                 # Save confirmation response
                 assistant_message = ChatMessage(
                     session_id=session_id,
                     role=MessageRole.ASSISTANT,
-                    message="✅ Changes applied successfully!"
+                    message=_RESPONSES["applied"]
                 )
-                db.add(assistant_message)
-                db.commit()
+                ChatService._save_exchange(db, user_message, assistant_message)
                 
                 return ChatResponse(
-                    message=f"✅ Changes for the '{domain.name}' domain have been applied successfully!",
-                    updated_config=domain.config_json
+                    message=_RESPONSES["applied_reply"].format(domain_name=domain.name),
+                    updated_config=config_json
                 )
             
-            elif user_msg_lower in ["no", "cancel", "n", "reject", "abort"]:
+            elif user_msg_lower in _CANCEL_WORDS:
                 # Rollback - clear pending patch
                 session.session_metadata = {}
-                db.commit()
+                session.last_activity_at = func.now()
                 
                 # Save cancellation response
                 assistant_message = ChatMessage(
                     session_id=session_id,
                     role=MessageRole.ASSISTANT,
-                    message="❌ Changes cancelled. What would you like to do instead?"
+                    message=_RESPONSES["cancelled"]
                 )
-                db.add(assistant_message)
-                db.commit()
+                ChatService._save_exchange(db, user_message, assistant_message)
                 
                 return ChatResponse(
-                    message="❌ Changes cancelled. What would you like to do instead?"
+                    message=_RESPONSES["cancelled"]
                 )
         
         # Create initial state
         initial_state = create_initial_state(
-            domain_config=domain.config_json,
+            domain_config=config_json,
             user_message=message_data.message,
             chat_history=chat_history
         )
@@ -271,46 +336,72 @@ class ChatService:
         # Turn number = number of LLM calls already made in this session before this message
         current_turn = session.total_llm_calls
         
+        # Nothing is staged yet; end the read transaction so no connection
+        # sits idle-in-transaction while the model responds
+        db.rollback()
+        
         try:
             with get_openai_callback() as cb:
-                # Use thread-aware invocation
-                final_state = domain_graph.invoke(initial_state, config=config)
+                # Await the graph so the event loop keeps serving other requests
+                final_state = await domain_graph.ainvoke(initial_state, config=config)
                 
                 # Update global monitoring stats
                 llm_monitor.update_tokens(
                     input_tokens=cb.prompt_tokens,
                     output_tokens=cb.completion_tokens,
-                    db=db
+                    db=db,
+                    calls=cb.successful_requests
                 )
                 
-                # Update session-level totals
-                session.total_llm_calls += cb.successful_requests
-                session.total_input_tokens += cb.prompt_tokens
-                session.total_output_tokens += cb.completion_tokens
-                
-                # Persist per-node call logs
-                node_logs = final_state.get("node_call_logs") or []
-                for log_entry in node_logs:
-                    node_log = NodeCallLog(
-                        session_id=session_id,
-                        turn=current_turn,
-                        node_name=log_entry["node_name"],
-                        input_tokens=log_entry["input_tokens"],
-                        output_tokens=log_entry["output_tokens"],
-                        response_time_ms=log_entry["response_time_ms"],
-                        intent=log_entry.get("intent"),
+                # All of the turn's session changes go in one UPDATE (one new
+                # row version). Totals are incremented in SQL (col = col + n),
+                # so concurrent turns on the same session cannot lose counts.
+                session_values = {
+                    "total_llm_calls": ChatSession.total_llm_calls + cb.successful_requests,
+                    "total_input_tokens": ChatSession.total_input_tokens + cb.prompt_tokens,
+                    "total_output_tokens": ChatSession.total_output_tokens + cb.completion_tokens,
+                    "last_activity_at": func.now(),
+                }
+                # If changes need confirmation, store in session metadata
+                if final_state.get("needs_confirmation"):
+                    session_values["session_metadata"] = {
+                        "pending_patch": final_state["proposed_patch"],
+                        "pending_updated_config": final_state["updated_config"]
+                    }
+                total_calls, total_tokens = db.execute(
+                    update(ChatSession)
+                    .where(ChatSession.id == session_id)
+                    .values(**session_values)
+                    .returning(
+                        ChatSession.total_llm_calls,
+                        ChatSession.total_input_tokens + ChatSession.total_output_tokens
                     )
-                    db.add(node_log)
+                    .execution_options(synchronize_session=False)
+                ).one()
                 
-                db.commit()
+                # Persist per-node call logs as a single multi-row INSERT
+                node_logs = final_state.get("node_call_logs") or []
+                if node_logs:
+                    db.execute(insert(NodeCallLog), [
+                        {
+                            "session_id": session_id,
+                            "turn": current_turn,
+                            "node_name": log_entry["node_name"],
+                            "input_tokens": log_entry["input_tokens"],
+                            "output_tokens": log_entry["output_tokens"],
+                            "response_time_ms": log_entry["response_time_ms"],
+                            "intent": log_entry.get("intent"),
+                        }
+                        for log_entry in node_logs
+                    ])
                 
-                print(f"📊 Session {session_id} | Turn {current_turn} | "
-                      f"Calls={session.total_llm_calls}, "
-                      f"Tokens={session.total_input_tokens + session.total_output_tokens} | "
-                      f"Nodes logged: {len(node_logs)}")
-        except Exception as e:
-            print(f"Error during graph execution or monitoring: {e}")
-            raise e
+                logger.info(
+                    "Session %s | Turn %d | Calls=%d, Tokens=%d | Nodes logged: %d",
+                    session_id, current_turn, total_calls, total_tokens, len(node_logs)
+                )
+        except Exception:
+            logger.exception("Error during graph execution or monitoring")
+            raise
         
         # Save assistant response
         assistant_message = ChatMessage(
@@ -318,16 +409,7 @@ class ChatService:
             role=MessageRole.ASSISTANT,
             message=final_state["assistant_response"]
         )
-        db.add(assistant_message)
-        
-        # If changes need confirmation, store in session metadata
-        if final_state.get("needs_confirmation"):
-            session.session_metadata = {
-                "pending_patch": final_state["proposed_patch"],
-                "pending_updated_config": final_state["updated_config"]
-            }
-        
-        db.commit()
+        ChatService._save_exchange(db, user_message, assistant_message)
         
         # Prepare response
         response = ChatResponse(
@@ -342,16 +424,34 @@ class ChatService:
         
         return response
     
+    @staticmethod
+    def _save_exchange(
+        db: Session,
+        user_message: ChatMessage,
+        assistant_message: ChatMessage
+    ) -> None:
+        """
+        Stage a turn's user message and reply.
+        
+        Both rows go out in one multi-row INSERT, where they can get the same
+        clock_timestamp(); messages are therefore ordered by (created_at, id),
+        and uuid7 ids increase monotonically, so the user message stays first.
+        """
+        db.add_all([user_message, assistant_message])
+    
     @staticmethod
     def get_messages(
         db: Session,
         session_id: UUID,
         user: User,
         limit: int = 50
-    ) -> List[ChatMessage]:
+    ) -> List[Row]:
         """
         Get messages for a session.
         
+        Selects the response columns only, so rows are returned as plain
+        tuples without building ChatMessage instances.
+        
         Args:
             db: Database session
             session_id: Session UUID
@@ -359,15 +459,28 @@ class ChatService:
             limit: Maximum number of messages
             
         Returns:
-            List of chat messages
+            List of chat message rows
         """
-        # Verify access
-        ChatService.get_session(db, session_id, user)
-        
-        messages = db.query(ChatMessage).filter(
-            ChatMessage.session_id == session_id
+        # Ownership is checked by the join, so the common case is one query
+        messages = db.query(
+            ChatMessage.id,
+            ChatMessage.session_id,
+            ChatMessage.role,
+            ChatMessage.message,
+            ChatMessage.created_at
+        ).join(
+            ChatSession, ChatSession.id == ChatMessage.session_id
+        ).filter(
+            ChatMessage.session_id == session_id,
+            ChatSession.user_id == user.id
         ).order_by(
-            ChatMessage.created_at.asc()
+            ChatMessage.created_at.asc(),
+            ChatMessage.id.asc()
         ).limit(limit).all()
         
+        if not messages:
+            # Sessions always start with a welcome message, so no rows means
+            # a missing or foreign session; get_session raises the 404/403
+            ChatService.get_session(db, session_id, user)
+        
         return messages
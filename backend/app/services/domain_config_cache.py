@@ -0,0 +1,111 @@
+"""In-process cache of domain config_json documents and domain responses."""
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple, TypeVar
+from uuid import UUID
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from app.models.domain_config import DomainConfig
+from app.schemas.domain import DomainConfigResponse
+from app.utils import json_utils
+
+_V = TypeVar("_V")
+
+# Serialized config_json keyed by (domain id, updated_at). Every write bumps
+# updated_at, so a stale entry is simply never looked up again and ages out.
+_CACHE: "OrderedDict[Tuple[UUID, datetime], str]" = OrderedDict()
+# Serialized DomainConfigResponse bodies, keyed the same way
+_RESPONSE_CACHE: "OrderedDict[Tuple[UUID, datetime], bytes]" = OrderedDict()
+_CACHE_SIZE = 256
+_lock = threading.Lock()
+
+
+def _lookup(cache: "OrderedDict[Tuple[UUID, datetime], _V]", key: Tuple[UUID, datetime]) -> Optional[_V]:
+    with _lock:
+        cached = cache.get(key)
+        if cached is not None:
+            cache.move_to_end(key)
+    return cached
+
+
+def _store(cache: "OrderedDict[Tuple[UUID, datetime], _V]", key: Tuple[UUID, datetime], value: _V) -> None:
+    with _lock:
+        cache[key] = value
+        cache.move_to_end(key)
+        if len(cache) > _CACHE_SIZE:
+            cache.popitem(last=False)
+
+
+def get_config_json(db: Session, domain_id: UUID, updated_at: datetime) -> Dict[str, Any]:
+    """
+    Get a domain's config_json, reading the JSONB column only on a cache miss.
+
+    Callers load the DomainConfig row with config_json deferred and pass its
+    updated_at. Entries are stored serialized, and each call decodes a fresh
+    dict, so callers can mutate the result freely.
+
+    Args:
+        db: Database session
+        domain_id: Domain UUID
+        updated_at: Current updated_at of the domain row
+
+    Returns:
+        Domain configuration dictionary
+    """
+    key = (domain_id, updated_at)
+    cached = _lookup(_CACHE, key)
+    if cached is not None:
+        return json_utils.loads(cached)
+
+    config_json = db.execute(
+        select(DomainConfig.config_json).where(DomainConfig.id == domain_id)
+    ).scalar_one()
+
+    _store(_CACHE, key, json_utils.dumps(config_json))
+    return config_json
+
+
+def get_response_json(db: Session, domain: DomainConfig) -> bytes:
+    """
+    Get the serialized DomainConfigResponse body for a domain.
+
+    The domain must already be access-checked and loaded with config_json
+    deferred; on a hit neither the document nor the response model is built.
+
+    Args:
+        db: Database session
+        domain: Domain row (config_json deferred)
+
+    Returns:
+        JSON response bytes
+    """
+    key = (domain.id, domain.updated_at)
+    cached = _lookup(_RESPONSE_CACHE, key)
+    if cached is not None:
+        return cached
+
+    payload = DomainConfigResponse.model_validate({
+        "id": domain.id,
+        "owner_user_id": domain.owner_user_id,
+        "name": domain.name,
+        "description": domain.description,
+        "version": domain.version,
+        "config_json": get_config_json(db, domain.id, domain.updated_at),
+        "entity_count": domain.entity_count,
+        "relationship_count": domain.relationship_count,
+        "extraction_pattern_count": domain.extraction_pattern_count,
+        "key_term_count": domain.key_term_count,
+        "created_at": domain.created_at,
+        "updated_at": domain.updated_at,
+    }).to_json_bytes()
+
+    _store(_RESPONSE_CACHE, key, payload)
+    return payload
+
+
+def clear() -> None:
+    """Drop all cached configs and responses."""
+    with _lock:
+        _CACHE.clear()
+        _RESPONSE_CACHE.clear()
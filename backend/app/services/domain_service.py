@@ -1,5 +1,6 @@
 """Domain configuration service."""
-from sqlalchemy.orm import Session
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session, defer, raiseload
 from fastapi import HTTPException, status
 from typing import List, Dict, Any
 from uuid import UUID
@@ -65,33 +66,50 @@ class DomainService:
             config_json=config_json
         )
         
-        # Update counts and metadata
+        # Sync name/description/version from the generated config
         db_domain.sync_from_config()
         
         db.add(db_domain)
         db.commit()
-        db.refresh(db_domain)
         
         return db_domain
     
     @staticmethod
-    def get_user_domains(db: Session, user: User) -> List[DomainConfig]:
+    def get_user_domains(db: Session, user: User) -> List[Row]:
         """
         Get all domains owned by a user.
         
+        Selects only the list columns as plain rows, so config_json is never
+        fetched or decoded and no DomainConfig instances are built.
+        
         Args:
             db: Database session
             user: Owner user
             
         Returns:
-            List of domain configurations
+            List of domain configuration summary rows
         """
-        return db.query(DomainConfig).filter(
+        return db.query(
+            DomainConfig.id,
+            DomainConfig.name,
+            DomainConfig.description,
+            DomainConfig.version,
+            DomainConfig.entity_count,
+            DomainConfig.relationship_count,
+            DomainConfig.extraction_pattern_count,
+            DomainConfig.key_term_count,
+            DomainConfig.updated_at
+        ).filter(
             DomainConfig.owner_user_id == user.id
         ).order_by(DomainConfig.updated_at.desc()).all()
     
     @staticmethod
-    def get_domain_by_id(db: Session, domain_id: UUID, user: User) -> DomainConfig:
+    def get_domain_by_id(
+        db: Session,
+        domain_id: UUID,
+        user: User,
+        defer_config: bool = False
+    ) -> DomainConfig:
         """
         Get a domain configuration by ID.
         
@@ -99,6 +117,8 @@ class DomainService:
             db: Database session
             domain_id: Domain UUID
             user: Current user
+            defer_config: Leave config_json unloaded (read it through
+                domain_config_cache instead)
             
         Returns:
             Domain configuration
@@ -106,7 +126,13 @@ class DomainService:
         Raises:
             HTTPException: If domain not found or access denied
         """
-        domain = db.query(DomainConfig).filter(DomainConfig.id == domain_id).first()
+        # Relationships must be requested explicitly; lazy loads raise
+        options = [raiseload("*")]
+        if defer_config:
+            options.append(defer(DomainConfig.config_json))
+        # Session.get answers from the identity map when this request has
+        # already loaded the row, so repeat lookups cost no SELECT
+        domain = db.get(DomainConfig, domain_id, options=options)
         
         if not domain:
             raise HTTPException(
@@ -155,7 +181,6 @@ class DomainService:
             domain.sync_from_config()
         
         db.commit()
-        db.refresh(domain)
         
         return domain
     
@@ -197,6 +222,5 @@ class DomainService:
         domain.sync_from_config()
         
         db.commit()
-        db.refresh(domain)
         
         return domain
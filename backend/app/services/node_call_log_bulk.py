@@ -0,0 +1,77 @@
+"""Bulk loading of NodeCallLog rows via PostgreSQL COPY.
+
+Used for administrative replay/backfill (e.g. rebuilding stats from legacy
+LangGraph traces), where even batched INSERTs are too slow. Request-time
+logging keeps using the Core ``insert(NodeCallLog)`` executemany in ChatService.
+"""
+import csv
+import io
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable
+from app.models.node_call_log import NODE_NAME_CODES, INTENT_CODES
+from app.utils.ids import uuid7
+
+
+COPY_NODE_CALL_LOGS_SQL = (
+    "COPY node_call_logs "
+    "(id, session_id, turn, node_name, input_tokens, output_tokens, response_time_ms, intent, created_at) "
+    "FROM STDIN WITH (FORMAT CSV)"
+)
+
+
+def _encode(codes: Dict[str, int], value: Any, column: str) -> Any:
+    """Map a node name / intent string to its stored SMALLINT code."""
+    if value is None:
+        return None
+    try:
+        return codes[value]
+    except KeyError:
+        raise ValueError(f"No SMALLINT code registered for {column}={value!r}") from None
+
+
+def copy_node_call_logs(conn, rows: Iterable[Dict[str, Any]]) -> int:
+    """
+    Stream NodeCallLog rows into PostgreSQL with a single COPY.
+
+    Rows use the same keys as the request-time Core ``insert(NodeCallLog)``
+    executemany in ChatService (``session_id``, ``turn``, ``node_name``,
+    ``input_tokens``, ``output_tokens``, ``response_time_ms``, ``intent``)
+    plus an optional ``created_at``. COPY bypasses SQLAlchemy's column
+    defaults and types, so ids are generated and the SMALLINT codes are
+    applied here. The caller owns the transaction.
+
+    Args:
+        conn: Raw psycopg2 connection, e.g. ``session.connection().connection``
+        rows: Node call log dicts
+
+    Returns:
+        Number of rows copied
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    count = 0
+
+    for row in rows:
+        created_at = row.get("created_at") or datetime.now(timezone.utc)
+        # None is written as an unquoted empty field, which COPY CSV reads as NULL
+        writer.writerow((
+            row.get("id") or uuid7(),
+            row["session_id"],
+            row.get("turn", 0),
+            _encode(NODE_NAME_CODES, row["node_name"], "node_name"),
+            row.get("input_tokens", 0),
+            row.get("output_tokens", 0),
+            row.get("response_time_ms", 0.0),
+            _encode(INTENT_CODES, row.get("intent"), "intent"),
+            created_at.isoformat(),
+        ))
+        count += 1
+
+    if not count:
+        return 0
+
+    buffer.seek(0)
+    with conn.cursor() as cursor:
+        cursor.copy_expert(COPY_NODE_CALL_LOGS_SQL, buffer)
+
+    return count
@@ -4,7 +4,7 @@ These utilities extract only the relevant portions of the domain configuration
 to send to the LLM, reducing token usage by 85-96%.
 """
 from typing import Dict, Any, List, Optional
-import json
+from app.utils import json_utils
 
 
 def get_relevant_entities(
@@ -81,22 +81,22 @@ def format_minimal_context(
     """
     # Domain-level operations
     if "domain" in intent:
-        return json.dumps({
+        return json_utils.dumps({
             "name": config.get("name"),
             "description": config.get("description"),
             "version": config.get("version")
-        }, indent=2)
+        }, pretty=True)
     
     # Entity operations
     if "entity" in intent and "relationship" not in intent:
         if target_name:
             entities = get_relevant_entities(config, [target_name])
             if entities:
-                return json.dumps({"entity": entities[0]}, indent=2)
+                return json_utils.dumps({"entity": entities[0]}, pretty=True)
         
         # Fallback: return entity info
         entities = [{"name": e["name"], "type": e["type"]} for e in config.get("entities", [])]
-        return json.dumps({"entities": entities}, indent=2)
+        return json_utils.dumps({"entities": entities}, pretty=True)
     
     # Relationship operations
     if "relationship" in intent:
@@ -105,31 +105,31 @@ def format_minimal_context(
             if relationships:
                 # Include entity names for reference validation
                 entities = [{"name": e["name"], "type": e["type"]} for e in config.get("entities", [])]
-                return json.dumps({
+                return json_utils.dumps({
                     "relationship": relationships[0],
                     "available_entities": entities
-                }, indent=2)
+                }, pretty=True)
         
         # Fallback: return relationship and entity info
         rel_names = [r["name"] for r in config.get("relationships", [])]
         entities = [{"name": e["name"], "type": e["type"]} for e in config.get("entities", [])]
-        return json.dumps({
+        return json_utils.dumps({
             "relationship_names": rel_names,
             "entities": entities
-        }, indent=2)
+        }, pretty=True)
     
     # Extraction pattern operations
     if "extraction_pattern" in intent:
         patterns = config.get("extraction_patterns", [])
         entity_types = [e["type"] for e in config.get("entities", [])]
-        return json.dumps({
+        return json_utils.dumps({
             "extraction_patterns": patterns,
             "available_entity_types": entity_types
-        }, indent=2)
+        }, pretty=True)
     
     # Key terms operations
     if "key_term" in intent:
-        return json.dumps({
+        return json_utils.dumps({
             "key_terms": config.get("key_terms", [])
         })
     
@@ -139,9 +139,9 @@ def format_minimal_context(
             entities = get_relevant_entities(config, [target_name])
             relationships = get_relevant_relationships(config, relationship_names=[target_name])
             if entities or relationships:
-                return json.dumps({
+                return json_utils.dumps({
                     "target": entities[0] if entities else relationships[0]
-                }, indent=2)
+                }, pretty=True)
 
     # Dense Markdown representation for minimal token usage
     md_lines = [f"Domain: {config.get('name')} (v{config.get('version')})", "Entities:"]
@@ -209,7 +209,7 @@ def get_context_size_reduction(
     Returns:
         Dict with size statistics
     """
-    full_size = len(json.dumps(full_config))
+    full_size = len(json_utils.dumps(full_config))
     minimal_size = len(minimal_context)
     reduction_pct = ((full_size - minimal_size) / full_size) * 100
     
@@ -0,0 +1,45 @@
+"""Primary key generation."""
+import os
+import threading
+import time
+import uuid
+
+_lock = threading.Lock()
+_last_ms = 0
+_counter = 0
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Generate a time-ordered UUIDv7 (RFC 9562).
+    
+    The leading 48 bits are the Unix time in milliseconds, so new keys land
+    on the rightmost B-tree pages instead of random leaves. rand_a holds a
+    12-bit counter (RFC 9562 method 1), so ids generated by this process
+    are strictly increasing even within one millisecond.
+    
+    Returns:
+        UUID with version 7
+    """
+    global _last_ms, _counter
+    rand = int.from_bytes(os.urandom(10), "big")
+    with _lock:
+        unix_ms = time.time_ns() // 1_000_000
+        if unix_ms > _last_ms:
+            # Random start with headroom below the 12-bit limit
+            _counter = (rand >> 64) & 0x7FF
+        else:
+            # Same millisecond or clock stepped back: keep counting
+            unix_ms = _last_ms
+            _counter += 1
+            if _counter > 0xFFF:
+                unix_ms += 1
+                _counter = 0
+        _last_ms = unix_ms
+        counter = _counter
+    value = (unix_ms & 0xFFFF_FFFF_FFFF) << 80
+    value |= 0x7 << 76                          # version
+    value |= counter << 64                      # rand_a: monotonic counter
+    value |= 0b10 << 62                         # RFC 4122 variant
+    value |= rand & 0x3FFF_FFFF_FFFF_FFFF       # rand_b
+    return uuid.UUID(int=value)
@@ -0,0 +1,48 @@
+"""JSON serialization helpers with an orjson fast path."""
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+
+def dumps(data: Any, pretty: bool = False) -> str:
+    """
+    Serialize data to a JSON string.
+
+    Non-ASCII characters are emitted as UTF-8 rather than escaped.
+
+    Args:
+        data: JSON-compatible object
+        pretty: Indent the output by two spaces
+
+    Returns:
+        JSON string
+    """
+    if _HAS_ORJSON:
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        return orjson.dumps(data, option=option).decode()
+    if pretty:
+        return json.dumps(data, indent=2, ensure_ascii=False)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+def loads(content: Union[str, bytes]) -> Any:
+    """
+    Parse a JSON document.
+
+    Args:
+        content: JSON text as str or UTF-8 bytes
+
+    Returns:
+        Parsed object
+
+    Raises:
+        ValueError: If the content is not valid JSON
+    """
+    if _HAS_ORJSON:
+        return orjson.loads(content)
+    return json.loads(content)
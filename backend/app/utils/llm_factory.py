@@ -1,6 +1,4 @@
 """Factory for creating LLM instances based on configuration."""
-from langchain_openai import ChatOpenAI
-from langchain_groq import ChatGroq
 from app.config import settings
 
 def get_llm(model: str = None, temperature: float = 0):
@@ -16,7 +14,9 @@ def get_llm(model: str = None, temperature: float = 0):
     """
     provider = settings.LLM_PROVIDER.lower()
     
+    # Provider SDKs are imported lazily so only the configured one is loaded
     if provider == "groq":
+        from langchain_groq import ChatGroq
         model_name = model or settings.GROQ_MODEL
         if not settings.GROQ_API_KEY:
              raise ValueError("GROQ_API_KEY is not set in environment")
@@ -27,6 +27,7 @@ def get_llm(model: str = None, temperature: float = 0):
         )
     else:
         # Default to OpenAI
+        from langchain_openai import ChatOpenAI
         model_name = model or settings.OPENAI_MODEL
         if not settings.OPENAI_API_KEY:
              raise ValueError("OPENAI_API_KEY is not set in environment")
@@ -37,25 +37,20 @@ class LLMMonitor:
             # Note: Token updates should be handled via update_tokens() 
             # as they are usually extracted from response metadata
     
-    def update_tokens(self, input_tokens: int, output_tokens: int, db=None):
-        """Update token counts in memory and optionally in DB."""
+    def update_tokens(self, input_tokens: int, output_tokens: int, db=None, calls: int = 0):
+        """Update token counts in memory and optionally stage a usage event in DB (the caller commits)."""
         self.total_input_tokens += input_tokens
         self.total_output_tokens += output_tokens
         
         if db:
             try:
-                from app.models.llm_usage import LLMUsage
-                usage = db.query(LLMUsage).first()
-                if not usage:
-                    usage = LLMUsage(total_calls=self.total_calls, 
-                                    total_input_tokens=self.total_input_tokens,
-                                    total_output_tokens=self.total_output_tokens)
-                    db.add(usage)
-                else:
-                    usage.total_calls = self.total_calls
-                    usage.total_input_tokens = self.total_input_tokens
-                    usage.total_output_tokens = self.total_output_tokens
-                db.commit()
+                from app.models.llm_usage import LLMUsageEvent
+                # Append-only: global totals are summed by the llm_usage_stats view
+                db.add(LLMUsageEvent(
+                    calls=calls,
+                    input_tokens=input_tokens,
+                    output_tokens=output_tokens
+                ))
             except Exception as e:
                 print(f"Error updating global LLM stats: {e}")
 
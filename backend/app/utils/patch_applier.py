@@ -3,7 +3,9 @@
 This module contains pure Python functions to apply patches at every hierarchical level.
 No LLM involvement - all operations are deterministic.
 """
-from typing import Dict, Any
+import copy
+from typing import Dict, Any, Callable, Iterable
+from pydantic import BaseModel
 from app.schemas.patch import PatchOperation
 
 
@@ -39,84 +41,42 @@ def apply_patch(config: Dict[str, Any], patch: PatchOperation) -> Dict[str, Any]
         ValueError: If operation fails (entity not found, duplicate, etc.)
     """
     # Create a deep copy to avoid mutating original
-    import copy
-    config = copy.deepcopy(config)
+    return _apply_in_place(copy.deepcopy(config), patch)
+
+
+def apply_patches(config: Dict[str, Any], patches: Iterable[PatchOperation]) -> Dict[str, Any]:
+    """
+    Apply a list of patch operations in order.
     
-    operation_map = {
-        # Domain-level
-        "update_domain_name": update_domain_name,
-        "update_domain_description": update_domain_description,
-        "update_domain_version": update_domain_version,
-        
-        # Entity operations
-        "add_entity": add_entity,
-        "update_entity_name": update_entity_name,
-        "update_entity_type": update_entity_type,
-        "update_entity_description": update_entity_description,
-        "delete_entity": delete_entity,
-        
-        # Entity attribute operations
-        "add_entity_attribute": add_entity_attribute,
-        "update_entity_attribute_name": update_entity_attribute_name,
-        "update_entity_attribute_description": update_entity_attribute_description,
-        "delete_entity_attribute": delete_entity_attribute,
-        
-        # Entity attribute examples
-        "add_entity_attribute_example": add_entity_attribute_example,
-        "update_entity_attribute_example": update_entity_attribute_example,
-        "delete_entity_attribute_example": delete_entity_attribute_example,
-        
-        # Entity synonyms
-        "add_entity_synonym": add_entity_synonym,
-        "update_entity_synonym": update_entity_synonym,
-        "delete_entity_synonym": delete_entity_synonym,
-        
-        # Relationship operations
-        "add_relationship": add_relationship,
-        "update_relationship_name": update_relationship_name,
-        "update_relationship_from": update_relationship_from,
-        "update_relationship_to": update_relationship_to,
-        "update_relationship_description": update_relationship_description,
-        "delete_relationship": delete_relationship,
-        
-        # Relationship attribute operations
-        "add_relationship_attribute": add_relationship_attribute,
-        "update_relationship_attribute_name": update_relationship_attribute_name,
-        "update_relationship_attribute_description": update_relationship_attribute_description,
-        "delete_relationship_attribute": delete_relationship_attribute,
-        
-        # Relationship attribute examples
-        "add_relationship_attribute_example": add_relationship_attribute_example,
-        "update_relationship_attribute_example": update_relationship_attribute_example,
-        "delete_relationship_attribute_example": delete_relationship_attribute_example,
+    The configuration is deep-copied once for the whole batch rather than
+    once per operation; the original is never mutated.
+    
+    Args:
+        config: Current domain configuration
+        patches: Patch operations to apply
         
-        # Extraction patterns
-        "add_extraction_pattern": add_extraction_pattern,
-        "update_extraction_pattern_pattern": update_extraction_pattern_pattern,
-        "update_extraction_pattern_entity_type": update_extraction_pattern_entity_type,
-        "update_extraction_pattern_attribute": update_extraction_pattern_attribute,
-        "update_extraction_pattern_extract_full_match": update_extraction_pattern_extract_full_match,
-        "update_extraction_pattern_confidence": update_extraction_pattern_confidence,
-        "delete_extraction_pattern": delete_extraction_pattern,
+    Returns:
+        Updated configuration
         
-        # Key terms
-        "add_key_term": add_key_term,
-        "update_key_term": update_key_term,
-        "delete_key_term": delete_key_term
-    }
+    Raises:
+        ValueError: If any operation fails (entity not found, duplicate, etc.)
+    """
+    config = copy.deepcopy(config)
+    for patch in patches:
+        config = _apply_in_place(config, patch)
+    return config
+
+
+def _apply_in_place(config: Dict[str, Any], patch: PatchOperation) -> Dict[str, Any]:
+    """Dispatch one operation onto a config the caller already owns."""
+    handler = _OPERATION_MAP.get(patch.operation)
+    if not handler:
+        raise ValueError(f"Unknown operation: {patch.operation}")
     
     # Convert Pydantic model payload to dict for compatibility with handlers
     # that expect dictionary subscripting like patch.payload['name']
-    if hasattr(patch, "payload") and patch.payload is not None:
-        if hasattr(patch.payload, "model_dump"):
-            # Using model_dump (pydantic v2) and excluding None to match dict expectation
-            setattr(patch, "payload", patch.payload.model_dump(by_alias=True, exclude_none=True))
-        elif hasattr(patch.payload, "dict"):
-            setattr(patch, "payload", patch.payload.dict(by_alias=True, exclude_none=True))
-
-    handler = operation_map.get(patch.operation)
-    if not handler:
-        raise ValueError(f"Unknown operation: {patch.operation}")
+    if isinstance(patch.payload, BaseModel):
+        patch.payload = patch.payload.model_dump(by_alias=True, exclude_none=True)
     
     return handler(config, patch)
 
@@ -758,3 +718,72 @@ def delete_key_term(config: Dict[str, Any], patch: PatchOperation) -> Dict[str,
         if t != patch.old_value
     ]
     return config
+
+
+# ============================================================================
+# DISPATCH TABLE
+# ============================================================================
+
+# Built once at import; apply_patch looks handlers up by operation name
+_OPERATION_MAP: Dict[str, Callable[[Dict[str, Any], PatchOperation], Dict[str, Any]]] = {
+    # Domain-level
+    "update_domain_name": update_domain_name,
+    "update_domain_description": update_domain_description,
+    "update_domain_version": update_domain_version,
+    
+    # Entity operations
+    "add_entity": add_entity,
+    "update_entity_name": update_entity_name,
+    "update_entity_type": update_entity_type,
+    "update_entity_description": update_entity_description,
+    "delete_entity": delete_entity,
+    
+    # Entity attribute operations
+    "add_entity_attribute": add_entity_attribute,
+    "update_entity_attribute_name": update_entity_attribute_name,
+    "update_entity_attribute_description": update_entity_attribute_description,
+    "delete_entity_attribute": delete_entity_attribute,
+    
+    # Entity attribute examples
+    "add_entity_attribute_example": add_entity_attribute_example,
+    "update_entity_attribute_example": update_entity_attribute_example,
+    "delete_entity_attribute_example": delete_entity_attribute_example,
+    
+    # Entity synonyms
+    "add_entity_synonym": add_entity_synonym,
+    "update_entity_synonym": update_entity_synonym,
+    "delete_entity_synonym": delete_entity_synonym,
+    
+    # Relationship operations
+    "add_relationship": add_relationship,
+    "update_relationship_name": update_relationship_name,
+    "update_relationship_from": update_relationship_from,
+    "update_relationship_to": update_relationship_to,
+    "update_relationship_description": update_relationship_description,
+    "delete_relationship": delete_relationship,
+    
+    # Relationship attribute operations
+    "add_relationship_attribute": add_relationship_attribute,
+    "update_relationship_attribute_name": update_relationship_attribute_name,
+    "update_relationship_attribute_description": update_relationship_attribute_description,
+    "delete_relationship_attribute": delete_relationship_attribute,
+    
+    # Relationship attribute examples
+    "add_relationship_attribute_example": add_relationship_attribute_example,
+    "update_relationship_attribute_example": update_relationship_attribute_example,
+    "delete_relationship_attribute_example": delete_relationship_attribute_example,
+    
+    # Extraction patterns
+    "add_extraction_pattern": add_extraction_pattern,
+    "update_extraction_pattern_pattern": update_extraction_pattern_pattern,
+    "update_extraction_pattern_entity_type": update_extraction_pattern_entity_type,
+    "update_extraction_pattern_attribute": update_extraction_pattern_attribute,
+    "update_extraction_pattern_extract_full_match": update_extraction_pattern_extract_full_match,
+    "update_extraction_pattern_confidence": update_extraction_pattern_confidence,
+    "delete_extraction_pattern": delete_extraction_pattern,
+    
+    # Key terms
+    "add_key_term": add_key_term,
+    "update_key_term": update_key_term,
+    "delete_key_term": delete_key_term
+}
@@ -1,8 +1,11 @@
 """RAG Management utility for PDF indexing and retrieval."""
+import heapq
 import os
 import tempfile
+import threading
+import time
 import requests
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from langchain_openai import OpenAIEmbeddings
 from langchain_community.document_loaders import PyPDFLoader
 from langchain_text_splitters import RecursiveCharacterTextSplitter
@@ -28,12 +31,34 @@ embeddings = OpenAIEmbeddings(
 _THREAD_RETRIEVERS: Dict[str, Any] = {}
 _THREAD_METADATA: Dict[str, dict] = {}
 
+# Retrievers expire after a TTL. Deadlines are monotonic floats kept in a
+# min-heap, so expiry pops only the k expired entries (O(k log n)) instead
+# of scanning every thread.
+_RETRIEVER_TTL_SECONDS = 60 * 60
+_THREAD_DEADLINES: Dict[str, float] = {}
+_EXPIRY_HEAP: List[Tuple[float, str]] = []
+_store_lock = threading.Lock()
+
+
+def _expire_retrievers(now: float) -> None:
+    """Drop retrievers whose deadline has passed; caller holds _store_lock."""
+    while _EXPIRY_HEAP and _EXPIRY_HEAP[0][0] <= now:
+        deadline, thread_id = heapq.heappop(_EXPIRY_HEAP)
+        # A re-ingested thread has a newer deadline; its old heap entry is stale
+        if _THREAD_DEADLINES.get(thread_id) == deadline:
+            del _THREAD_DEADLINES[thread_id]
+            _THREAD_RETRIEVERS.pop(thread_id, None)
+            _THREAD_METADATA.pop(thread_id, None)
+
 
 def _get_retriever(thread_id: Optional[str]):
-    """Fetch the retriever for a thread if available."""
-    if thread_id and thread_id in _THREAD_RETRIEVERS:
-        return _THREAD_RETRIEVERS[thread_id]
-    return None
+    """Fetch the retriever for a thread if available and not expired."""
+    if not thread_id:
+        return None
+    deadline = _THREAD_DEADLINES.get(thread_id)
+    if deadline is None or deadline <= time.monotonic():
+        return None
+    return _THREAD_RETRIEVERS.get(thread_id)
 
 
 def ingest_pdf(file_bytes: bytes, thread_id: str, filename: Optional[str] = None) -> dict:
@@ -67,16 +92,23 @@ def ingest_pdf(file_bytes: bytes, thread_id: str, filename: Optional[str] = None
             search_kwargs={"k": 4}
         )
 
-        # Store for the session
+        # Store for the session, expiring old threads on the way
         thread_id_str = str(thread_id)
-        _THREAD_RETRIEVERS[thread_id_str] = retriever
-        _THREAD_METADATA[thread_id_str] = {
+        metadata = {
             "filename": filename or os.path.basename(temp_path),
             "documents": len(docs),
             "chunks": len(chunks),
         }
-
-        return _THREAD_METADATA[thread_id_str]
+        with _store_lock:
+            now = time.monotonic()
+            _expire_retrievers(now)
+            deadline = now + _RETRIEVER_TTL_SECONDS
+            _THREAD_RETRIEVERS[thread_id_str] = retriever
+            _THREAD_METADATA[thread_id_str] = metadata
+            _THREAD_DEADLINES[thread_id_str] = deadline
+            heapq.heappush(_EXPIRY_HEAP, (deadline, thread_id_str))
+
+        return metadata
     finally:
         # Clean up temp file
         try:
@@ -1,7 +1,12 @@
 """Security utilities for JWT and password hashing."""
-from datetime import datetime, timedelta
-from typing import Optional
-from jose import JWTError, jwt
+import base64
+import time
+from datetime import timedelta
+from functools import lru_cache
+from typing import Optional, Tuple
+from uuid import UUID
+import jwt
+from jwt import InvalidTokenError
 from passlib.context import CryptContext
 from app.config import settings
 from app.schemas.user import TokenData
@@ -9,6 +14,15 @@ from app.schemas.user import TokenData
 # Password hashing context
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# Hash prefixes pwd_context can verify; anything else is rejected without hashing
+_HASH_PREFIXES = ("$2a$", "$2b$", "$2y$")
+
+# JWT key material and algorithm, fixed for the process lifetime
+_SECRET = settings.SECRET_KEY.encode() if isinstance(settings.SECRET_KEY, str) else settings.SECRET_KEY
+_ALG = settings.ALGORITHM
+_ALGORITHMS = (_ALG,)
+_ACCESS_TTL = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
@@ -21,6 +35,8 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         True if password matches, False otherwise
     """
+    if not hashed_password or not hashed_password.startswith(_HASH_PREFIXES):
+        return False
     return pwd_context.verify(plain_password, hashed_password)
 
 
@@ -48,15 +64,60 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     Returns:
         Encoded JWT token
     """
-    to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    ttl_seconds = int(expires_delta.total_seconds()) if expires_delta else _ACCESS_TTL
+    
+    # exp is a NumericDate; compute it from epoch seconds directly
+    return jwt.encode({**data, "exp": int(time.time()) + ttl_seconds}, _SECRET, algorithm=_ALG)
+
+
+def encode_subject(user_id: UUID) -> str:
+    """
+    Encode a user id for the JWT ``sub`` claim.
+    
+    Uses unpadded base64url of the 16 raw bytes (22 chars instead of 36).
+    
+    Args:
+        user_id: User UUID
+        
+    Returns:
+        Compact subject string
+    """
+    return base64.urlsafe_b64encode(user_id.bytes).rstrip(b"=").decode("ascii")
+
+
+def _decode_subject(sub: str) -> UUID:
+    """Parse a ``sub`` claim; tokens issued before the compact form carry the hex UUID."""
+    if len(sub) == 36:
+        return UUID(sub)
+    raw = base64.urlsafe_b64decode(sub + "==")
+    if len(raw) != 16:
+        raise ValueError("Invalid subject")
+    return UUID(bytes=raw)
+
+
+@lru_cache(maxsize=4096)
+def _decode_claims(token: str) -> Tuple[TokenData, Optional[int]]:
+    """
+    Verify a token once and cache its claims.
+    
+    The signature check is deterministic for a given token, so only the
+    expiry has to be re-checked on later hits (see decode_access_token).
+    Invalid tokens raise instead of returning, so lru_cache never stores
+    them and junk tokens cannot evict valid entries.
     
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
-    return encoded_jwt
+    Raises:
+        InvalidTokenError: If the token is invalid or has no subject
+        ValueError: If the subject is not a UUID
+    """
+    payload = jwt.decode(token, _SECRET, algorithms=_ALGORITHMS)
+    user_id: str = payload.get("sub")
+    email: str = payload.get("email")
+    
+    if user_id is None:
+        raise InvalidTokenError("Missing subject")
+    
+    # Claims were signed by us, so no field validation; only the UUID is parsed
+    return TokenData(user_id=_decode_subject(user_id), email=email), payload.get("exp")
 
 
 def decode_access_token(token: str) -> Optional[TokenData]:
@@ -70,13 +131,10 @@ def decode_access_token(token: str) -> Optional[TokenData]:
         TokenData if valid, None otherwise
     """
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        user_id: str = payload.get("sub")
-        email: str = payload.get("email")
-        
-        if user_id is None:
-            return None
-            
-        return TokenData(user_id=user_id, email=email)
-    except JWTError:
+        token_data, exp = _decode_claims(token)
+    except (InvalidTokenError, ValueError):
+        return None
+    
+    if exp is not None and exp <= time.time():
         return None
+    return token_data
@@ -1,5 +1,4 @@
 """Base domain configuration template."""
-import json
 import os
 import asyncio
 import logging
@@ -10,6 +9,7 @@ from typing import Dict, Any, List, Optional, Any
 from dotenv import load_dotenv
 from app.config import settings
 from app.schemas.domain import DomainConfigSchema
+from app.utils import json_utils
 
 # Set up logging
 logger = logging.getLogger("uvicorn.error")
@@ -82,7 +82,7 @@ async def generate_domain_template(
             )
             
             # Use the base template as a clear schema indicator in the prompt
-            schema_json = json.dumps(get_base_template(domain_name, description, version), indent=2)
+            schema_json = json_utils.dumps(get_base_template(domain_name, description, version), pretty=True)
             user_msg = f"{prompt_content}\n\nOutput MUST strictly follow this JSON structure:\n{schema_json}"
             
             messages = [("system", system_msg), ("user", user_msg)]
@@ -95,7 +95,7 @@ async def generate_domain_template(
             json_match = re.search(r'(\{.*\})', content, re.DOTALL)
             if json_match:
                 try:
-                    parsed_data = json.loads(json_match.group(1))
+                    parsed_data = json_utils.loads(json_match.group(1))
                     # Ensure name/version are preserved even if LLM missed them
                     if parsed_data.get("name") == "DomainName":
                         parsed_data["name"] = domain_name
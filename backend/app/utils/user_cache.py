@@ -0,0 +1,162 @@
+"""Optional Redis cache for user-by-id lookups and recent logins."""
+import hashlib
+import hmac
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional
+from uuid import UUID
+from app.config import settings
+from app.utils import json_utils
+
+try:
+    import redis
+    _HAS_REDIS = True
+except ImportError:
+    redis = None
+    _HAS_REDIS = False
+
+_TTL_SECONDS = 300
+# Recently verified credentials skip bcrypt for this long
+_LOGIN_TTL_SECONDS = 60
+# Fail fast so a slow or down Redis degrades to the database lookup
+_SOCKET_TIMEOUT = 0.1
+# After a Redis error the cache is skipped for this long. Calls are made
+# from async dependencies, so an outage costs one timeout on the event loop
+# per window instead of one per request.
+_RETRY_AFTER_SECONDS = 30.0
+
+_client = None
+_disabled_until = 0.0
+
+
+_LOGIN_KEY_SECRET = settings.SECRET_KEY.encode() if isinstance(settings.SECRET_KEY, str) else settings.SECRET_KEY
+
+
+def _key(user_id: Any) -> str:
+    return f"user:id:{user_id}"
+
+
+def _login_key(email: str, password: str, password_hash: str) -> str:
+    # Keyed HMAC, not a bare hash: without the server secret the keys
+    # cannot be used to brute-force passwords. The stored hash is part of
+    # the key, so a password change makes old entries unreachable.
+    digest = hmac.new(
+        _LOGIN_KEY_SECRET,
+        f"{email.lower()}\0{password}\0{password_hash}".encode(),
+        hashlib.sha256
+    )
+    return f"auth:{digest.hexdigest()}"
+
+
+def _get_client():
+    """Create the Redis client on first use; None when caching is disabled."""
+    global _client
+    if time.monotonic() < _disabled_until:
+        return None
+    if _client is None and _HAS_REDIS and settings.REDIS_URL:
+        _client = redis.Redis.from_url(
+            settings.REDIS_URL,
+            socket_timeout=_SOCKET_TIMEOUT,
+            socket_connect_timeout=_SOCKET_TIMEOUT,
+        )
+    return _client
+
+
+def _disable() -> None:
+    """Skip Redis for _RETRY_AFTER_SECONDS after an error."""
+    global _disabled_until
+    _disabled_until = time.monotonic() + _RETRY_AFTER_SECONDS
+
+
+def get_user(user_id: Any) -> Optional[Dict[str, Any]]:
+    """
+    Get the cached public fields of a user.
+    
+    Args:
+        user_id: User UUID
+        
+    Returns:
+        Dict with id, email and created_at, or None on a miss/outage
+    """
+    client = _get_client()
+    if client is None:
+        return None
+    try:
+        raw = client.get(_key(user_id))
+    except redis.RedisError:
+        _disable()
+        return None
+    if raw is None:
+        return None
+    data = json_utils.loads(raw)
+    return {
+        "id": UUID(data["id"]),
+        "email": data["email"],
+        "created_at": datetime.fromisoformat(data["created_at"]),
+    }
+
+
+def set_user(user) -> None:
+    """
+    Cache the public fields of a user (never the password hash).
+    
+    Args:
+        user: User object
+    """
+    client = _get_client()
+    if client is None:
+        return
+    payload = json_utils.dumps({
+        "id": str(user.id),
+        "email": user.email,
+        "created_at": user.created_at.isoformat(),
+    })
+    try:
+        client.setex(_key(user.id), _TTL_SECONDS, payload)
+    except redis.RedisError:
+        _disable()
+
+
+def get_login(email: str, password: str, password_hash: str) -> Optional[str]:
+    """
+    Get the user id of a recently verified email/password pair.
+    
+    Args:
+        email: Login email
+        password: Plain text password
+        password_hash: The user's current stored hash
+        
+    Returns:
+        User id string, or None on a miss/outage
+    """
+    client = _get_client()
+    if client is None:
+        return None
+    try:
+        raw = client.get(_login_key(email, password, password_hash))
+    except redis.RedisError:
+        _disable()
+        return None
+    return raw.decode() if raw is not None else None
+
+
+def set_login(email: str, password: str, password_hash: str, user_id: Any) -> None:
+    """
+    Remember a verified email/password pair for a short time.
+    
+    The entry is bound to the hash it was verified against; once the
+    password changes, lookups with the new hash no longer find it.
+    
+    Args:
+        email: Login email
+        password: Plain text password
+        password_hash: Hash the password was verified against
+        user_id: User UUID
+    """
+    client = _get_client()
+    if client is None:
+        return
+    try:
+        client.setex(_login_key(email, password, password_hash), _LOGIN_TTL_SECONDS, str(user_id))
+    except redis.RedisError:
+        _disable()
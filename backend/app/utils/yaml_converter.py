@@ -1,8 +1,15 @@
 """YAML conversion utilities."""
 import yaml
-import json
 from typing import Dict, Any
 
+# Prefer the C-backed LibYAML loader and dumper; fall back to the pure-Python ones
+try:
+    from yaml import CSafeLoader as _YAMLLoader
+    from yaml import CSafeDumper as _YAMLDumper
+except ImportError:
+    from yaml import SafeLoader as _YAMLLoader
+    from yaml import SafeDumper as _YAMLDumper
+
 
 def json_to_yaml(config_json: Dict[str, Any]) -> str:
     """
@@ -14,7 +21,7 @@ def json_to_yaml(config_json: Dict[str, Any]) -> str:
     Returns:
         YAML string representation
     """
-    return yaml.dump(config_json, default_flow_style=False, sort_keys=False, allow_unicode=True)
+    return yaml.dump(config_json, Dumper=_YAMLDumper, default_flow_style=False, sort_keys=False, allow_unicode=True)
 
 
 def yaml_to_json(yaml_str: str) -> Dict[str, Any]:
@@ -30,7 +37,7 @@ def yaml_to_json(yaml_str: str) -> Dict[str, Any]:
     Raises:
         yaml.YAMLError: If YAML is invalid
     """
-    return yaml.safe_load(yaml_str)
+    return yaml.load(yaml_str, Loader=_YAMLLoader)
 
 
 def validate_yaml(yaml_str: str) -> bool:
@@ -44,7 +51,7 @@ def validate_yaml(yaml_str: str) -> bool:
         True if valid, False otherwise
     """
     try:
-        yaml.safe_load(yaml_str)
+        yaml.load(yaml_str, Loader=_YAMLLoader)
         return True
     except yaml.YAMLError:
         return False